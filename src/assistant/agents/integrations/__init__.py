@@ -1,34 +1,86 @@
-"""External service integrations for agents."""
+"""External service integrations for agents.
 
-from .github import (
-    create_github_pull_request,
-    close_github_pull_request,
-    list_github_pull_requests,
+Submodules are loaded lazily (PEP 562): importing this package does not
+pull in the PyGithub or jira SDK import chains until a GitHub or Jira
+function is actually accessed.
+"""
+
+import importlib
+from typing import Any, Dict
+
+_GITHUB_EXPORTS = frozenset(
+    {
+        "create_github_pull_request",
+        "close_github_pull_request",
+        "list_github_pull_requests",
+        "prefetch_org_pulls",
+    }
 )
-from .jira import (
-    add_jira_comment,
-    create_jira_issue,
-    get_jira_issue,
-    update_jira_issue_status,
+_JIRA_EXPORTS = frozenset(
+    {
+        "add_jira_comment",
+        "create_jira_issue",
+        "get_jira_issue",
+        "update_jira_issue_status",
+    }
 )
 
 
-# For backward compatibility, create class-like namespaces
-class JiraAgent:
-    """JIRA integration functions."""
+class _LazyNamespace:
+    """Class-like namespace resolving attributes from a submodule on first use.
+
+    Resolved functions are cached on the instance, so only the first access
+    pays the import; later lookups are plain attribute reads.
+    """
+
+    def __init__(self, module_name: str, attr_map: Dict[str, str]) -> None:
+        self._module_name = module_name
+        self._attr_map = attr_map
+
+    def __getattr__(self, name: str) -> Any:
+        target = self._attr_map.get(name)
+        if target is None:
+            raise AttributeError(
+                f"{self._module_name!r} namespace has no attribute {name!r}"
+            )
+        module = importlib.import_module(self._module_name, __name__)
+        func = getattr(module, target)
+        setattr(self, name, func)
+        return func
+
+
+# For backward compatibility, expose class-like namespaces
+JiraAgent = _LazyNamespace(
+    ".jira",
+    {
+        "get_issue": "get_jira_issue",
+        "update_status": "update_jira_issue_status",
+        "add_comment": "add_jira_comment",
+        "create_issue": "create_jira_issue",
+    },
+)
+
+GithubAgent = _LazyNamespace(
+    ".github",
+    {
+        "create_pull_request": "create_github_pull_request",
+        "close_pull_request": "close_github_pull_request",
+        "list_pull_requests": "list_github_pull_requests",
+        "prefetch_org_pulls": "prefetch_org_pulls",
+    },
+)
 
-    get_issue = staticmethod(get_jira_issue)
-    update_status = staticmethod(update_jira_issue_status)
-    add_comment = staticmethod(add_jira_comment)
-    create_issue = staticmethod(create_jira_issue)
 
+def __getattr__(name: str) -> Any:
+    if name in _GITHUB_EXPORTS:
+        from . import github as _github
 
-class GithubAgent:
-    """GitHub integration functions."""
+        return getattr(_github, name)
+    if name in _JIRA_EXPORTS:
+        from . import jira as _jira
 
-    create_pull_request = staticmethod(create_github_pull_request)
-    close_pull_request = staticmethod(close_github_pull_request)
-    list_pull_requests = staticmethod(list_github_pull_requests)
+        return getattr(_jira, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 __all__ = [
@@ -41,4 +93,5 @@ __all__ = [
     "create_github_pull_request",
     "close_github_pull_request",
     "list_github_pull_requests",
-]
\ No newline at end of file
+    "prefetch_org_pulls",
+]
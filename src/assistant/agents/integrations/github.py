@@ -10,8 +10,13 @@ Functions:
     list_github_pull_requests: List pull requests from a repository
 """
 
+import functools
+import hashlib
+import itertools
 import logging
-from typing import Any, Dict, List, Optional
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
 
 from github import Github, GithubException
 
@@ -20,17 +25,139 @@ from assistant.config.manager import AssistantConfig
 logger = logging.getLogger(__name__)
 
 
-def _get_github_client() -> tuple[Optional[Github], Optional[str]]:
+@functools.lru_cache(maxsize=1)
+def _config() -> AssistantConfig:
+    """Load the assistant configuration once per process."""
+    return AssistantConfig()
+
+
+def reload_config() -> None:
+    """Clear cached configuration so the next access re-reads disk."""
+    _config.cache_clear()
+    _TOKEN_POOL.reset()
+
+
+class _TTLCache:
+    """Minimal in-process cache whose entries expire after a fixed TTL."""
+
+    def __init__(self, maxsize: int, ttl: float) -> None:
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._data: Dict[Any, Tuple[float, Any]] = {}
+
+    def get(self, key: Any) -> Optional[Any]:
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if time.monotonic() >= expires_at:
+            del self._data[key]
+            return None
+        return value
+
+    def set(self, key: Any, value: Any) -> None:
+        if len(self._data) >= self._maxsize:
+            now = time.monotonic()
+            expired = [k for k, (exp, _) in self._data.items() if exp <= now]
+            for k in expired:
+                del self._data[k]
+            if len(self._data) >= self._maxsize:
+                # Evict the oldest insertion to stay within bounds
+                self._data.pop(next(iter(self._data)))
+        self._data[key] = (time.monotonic() + self._ttl, value)
+
+    def clear(self) -> None:
+        self._data.clear()
+
+
+# Valid argument values for PR listing
+_VALID_STATES = frozenset({"open", "closed", "all"})
+_VALID_SORTS = frozenset({"created", "updated", "popularity", "long-running"})
+_VALID_DIRECTIONS = frozenset({"asc", "desc"})
+
+
+def _validation_error(errors: List[str]) -> Dict[str, Any]:
+    """Build the standard validation-error response."""
+    return {
+        "success": False,
+        "error": "; ".join(errors),
+        "error_type": "validation_error",
+    }
+
+
+# PR listings are polled by agents; a short TTL turns tight polling loops
+# into zero API calls without serving stale data for long.
+_PR_LIST_CACHE = _TTLCache(maxsize=512, ttl=15)
+# Tokens whose auth probe succeeded; verified once per process. A token
+# revoked mid-session surfaces as a 401 on the real API call, which every
+# public function already maps to authentication_error.
+_VERIFIED_TOKENS: set[str] = set()
+# Repository objects memoized by (full_name, per_page); lookups are pure
+# reads and a repository handle stays valid for the process lifetime.
+_REPO_CACHE: Dict[Tuple[str, int], Any] = {}
+# Github clients reused per (token fingerprint, per_page) so the
+# underlying urllib3 pool and its TLS connections survive across calls.
+_CLIENT_CACHE: Dict[Tuple[str, int], Github] = {}
+
+
+def _token_fingerprint(token: str) -> str:
+    """Return a short non-reversible cache key for an API token."""
+    return hashlib.blake2b(token.encode("utf-8"), digest_size=16).hexdigest()
+
+
+class _GithubTokenPool:
+    """Round-robin pool over one or more configured GitHub API tokens.
+
+    Reads ``github.api_keys`` (list) from the configuration, falling back
+    to the scalar ``github.api_key``. Rotating tokens spreads requests
+    across their individual rate-limit budgets.
+    """
+
+    def __init__(self) -> None:
+        self._tokens: Optional[List[str]] = None
+        self._cycle = None
+
+    def _load(self) -> None:
+        config = _config()
+        tokens = config.get_option("github", "api_keys")
+        if not tokens:
+            single = config.get_option("github", "api_key")
+            tokens = [single] if single else []
+        if isinstance(tokens, str):
+            tokens = [tokens]
+        self._tokens = [t for t in tokens if t]
+        self._cycle = itertools.cycle(self._tokens) if self._tokens else None
+
+    def next_token(self) -> Optional[str]:
+        """Return the next token in rotation, or None if none configured."""
+        if self._tokens is None:
+            self._load()
+        if not self._tokens:
+            return None
+        return next(self._cycle)
+
+    def reset(self) -> None:
+        """Forget loaded tokens so the next use re-reads configuration."""
+        self._tokens = None
+        self._cycle = None
+
+
+_TOKEN_POOL = _GithubTokenPool()
+
+
+def _get_github_client(per_page: int = 30) -> tuple[Optional[Github], Optional[str]]:
     """
     Create and return a GitHub client instance using configuration.
 
+    Args:
+        per_page: Page size the client requests from the API (default: 30)
+
     Returns:
         tuple: (Github client instance, error message)
                Returns (None, error_msg) if configuration is missing or invalid
     """
     try:
-        config = AssistantConfig()
-        token = config.get_option("github", "api_key")
+        token = _TOKEN_POOL.next_token()
 
         if not token:
             return None, (
@@ -38,22 +165,323 @@ def _get_github_client() -> tuple[Optional[Github], Optional[str]]:
                 ".fsc-assistant.env.toml with [github] section containing: api_key"
             )
 
-        # Create GitHub client with token
-        github_client = Github(token)
+        # Reuse a pooled client per token so TCP/TLS connections persist
+        # across calls instead of being re-established each time.
+        token_key = _token_fingerprint(token)
+        github_client = _CLIENT_CACHE.get((token_key, per_page))
+        if github_client is None:
+            github_client = Github(token, per_page=per_page, pool_size=16)
+            _CLIENT_CACHE[(token_key, per_page)] = github_client
+
+        # Test authentication by getting the authenticated user, once per
+        # token per process; afterwards rely on 401 handling downstream.
+        if token_key not in _VERIFIED_TOKENS:
+            try:
+                github_client.get_user().login
+            except GithubException as e:
+                if e.status == 401:
+                    return None, "Authentication failed. Please check your GitHub api_key."
+                raise
+            _VERIFIED_TOKENS.add(token_key)
+
+        return github_client, None
+
+    except Exception as e:
+        logger.error(f"Failed to create GitHub client: {e}")
+        return None, f"Failed to create GitHub client: {str(e)}"
+
+
+def _is_secondary_rate_limit(e: GithubException) -> bool:
+    """Tell a secondary-rate-limit 403 apart from a real permission error."""
+    if e.status != 403:
+        return False
+    headers = getattr(e, "headers", None) or {}
+    if headers.get("Retry-After") or headers.get("retry-after"):
+        return True
+    message = ""
+    if isinstance(e.data, dict):
+        message = str(e.data.get("message", ""))
+    message = message.lower()
+    return "secondary rate limit" in message or "abuse detection" in message
 
-        # Test authentication by getting the authenticated user
+
+def _with_rate_limit_retry(operation, max_attempts: int = 4, base_delay: float = 0.5):
+    """
+    Run a GitHub API operation, backing off on secondary rate limits.
+
+    GitHub reuses 403 for both permission errors and secondary rate
+    limits; the latter are transient and carry a Retry-After header.
+    Retry those with bounded exponential backoff and let every other
+    exception propagate to the callers' existing error mapping.
+
+    Args:
+        operation: Zero-argument callable performing the API request
+        max_attempts: Total attempts including the first (default: 4)
+        base_delay: Backoff base in seconds when no Retry-After is given
+
+    Returns:
+        Whatever the operation returns
+    """
+    for attempt in range(max_attempts):
         try:
-            github_client.get_user().login
+            return operation()
         except GithubException as e:
+            if attempt + 1 >= max_attempts or not _is_secondary_rate_limit(e):
+                raise
+            headers = getattr(e, "headers", None) or {}
+            retry_after = headers.get("Retry-After") or headers.get("retry-after")
+            if retry_after:
+                delay = min(int(retry_after), 60)
+            else:
+                delay = base_delay * (2**attempt)
+            logger.warning(
+                f"GitHub secondary rate limit hit; retrying in {delay:.1f}s "
+                f"(attempt {attempt + 1}/{max_attempts})"
+            )
+            time.sleep(delay)
+
+
+def _build_pr_dict(pr: Any) -> Dict[str, Any]:
+    """
+    Build the standard PR response dict from the already-downloaded JSON.
+
+    Reading pr.raw_data avoids PyGithub's lazy property descriptors, some
+    of which issue extra HTTP requests to hydrate sub-objects (user,
+    head/base repos). Timestamps arrive from the API in ISO 8601 already.
+
+    Args:
+        pr: PyGithub PullRequest object
+
+    Returns:
+        dict with the PR fields exposed by this module's tool contract
+    """
+    raw = pr.raw_data
+    return {
+        "number": raw["number"],
+        "url": raw["url"],
+        "html_url": raw["html_url"],
+        "title": raw["title"],
+        "body": raw.get("body") or "",
+        "state": raw["state"],
+        "draft": raw.get("draft", False),
+        "head": {"ref": raw["head"]["ref"], "sha": raw["head"]["sha"]},
+        "base": {"ref": raw["base"]["ref"], "sha": raw["base"]["sha"]},
+        "created_at": raw.get("created_at"),
+        "updated_at": raw.get("updated_at"),
+        "user": {"login": (raw.get("user") or {}).get("login")},
+    }
+
+
+def _parse_repo(repo: str) -> tuple[Optional[str], Optional[str], Optional[Dict[str, Any]]]:
+    """
+    Split a repository specification into owner and name.
+
+    Args:
+        repo: "owner/repo", or just "repo" when default_owner is configured
+
+    Returns:
+        tuple: (owner, repo_name, error_dict); error_dict is None on success
+    """
+    if "/" in repo:
+        owner, repo_name = repo.split("/", 1)
+        return owner, repo_name, None
+
+    default_owner = _config().get_option("github", "default_owner")
+    if not default_owner:
+        return None, None, {
+            "success": False,
+            "error": (
+                f"Repository '{repo}' is missing owner. Either provide "
+                "'owner/repo' format or configure 'default_owner' in "
+                "[github] section of .fsc-assistant.env.toml"
+            ),
+            "error_type": "validation_error",
+        }
+    return default_owner, repo, None
+
+
+def _resolve_repository(
+    owner: str, repo_name: str, per_page: int = 30
+) -> tuple[Optional[Any], Optional[Dict[str, Any]]]:
+    """
+    Fetch a Repository object, memoizing successful lookups per process.
+
+    Args:
+        owner: Repository owner
+        repo_name: Repository name
+        per_page: Page size for the underlying client (default: 30)
+
+    Returns:
+        tuple: (repository, error_dict); error_dict is None on success
+    """
+    full_name = f"{owner}/{repo_name}"
+    cached = _REPO_CACHE.get((full_name, per_page))
+    if cached is not None:
+        return cached, None
+
+    github_client, error = _get_github_client(per_page=per_page)
+    if error:
+        return None, {
+            "success": False,
+            "error": error,
+            "error_type": "configuration_error",
+        }
+
+    try:
+        repository = _with_rate_limit_retry(lambda: github_client.get_repo(full_name))
+    except GithubException as e:
+        logger.error(f"GitHub error accessing repository {full_name}: {e}")
+
+        if e.status == 404:
+            return None, {
+                "success": False,
+                "error": f"Repository not found: {full_name}",
+                "error_type": "repository_not_found",
+            }
+        elif e.status == 401:
+            return None, {
+                "success": False,
+                "error": "Authentication failed. Please check your GitHub token.",
+                "error_type": "authentication_error",
+            }
+        elif e.status == 403:
+            return None, {
+                "success": False,
+                "error": f"Permission denied for repository: {full_name}",
+                "error_type": "permission_error",
+            }
+        else:
+            return None, {
+                "success": False,
+                "error": f"GitHub error: {str(e)}",
+                "error_type": "github_error",
+            }
+
+    _REPO_CACHE[(full_name, per_page)] = repository
+    return repository, None
+
+
+def prefetch_org_pulls(owner: str, state: str = "open") -> Dict[str, Any]:
+    """
+    Warm the PR-list cache for all repositories of an owner in one query.
+
+    Issues a single search query (``is:pr org:{owner} state:{state}``)
+    instead of one get_repo + get_pulls round trip per repository, groups
+    the results by repository, and stores them in the TTL cache under the
+    default listing key so subsequent ``list_github_pull_requests`` calls
+    within the TTL window hit the cache.
+
+    The search API does not return branch details, so prefetched entries
+    carry ``head``/``base`` refs and shas as None; callers that need branch
+    information should query the specific repository directly.
+
+    Args:
+        owner: Organization or user whose repositories to prefetch
+        state: Filter by state - "open" or "closed" (default: "open")
+
+    Returns:
+        dict with keys:
+            - success: bool
+            - repositories: int (number of repositories cached, if success=True)
+            - pull_requests: int (total PRs cached, if success=True)
+            - error: str (if success=False)
+            - error_type: str (if success=False)
+    """
+    try:
+        if not owner or not owner.strip():
+            return {
+                "success": False,
+                "error": "Owner is required",
+                "error_type": "validation_error",
+            }
+        if state not in ["open", "closed"]:
+            return {
+                "success": False,
+                "error": "State must be 'open' or 'closed'",
+                "error_type": "validation_error",
+            }
+
+        github_client, error = _get_github_client()
+        if error:
+            return {
+                "success": False,
+                "error": error,
+                "error_type": "configuration_error",
+            }
+
+        try:
+            issues = github_client.search_issues(f"is:pr org:{owner} state:{state}")
+            by_repo: Dict[str, List[Dict[str, Any]]] = {}
+            for issue in issues:
+                raw = issue.raw_data
+                # repository_url is ".../repos/{owner}/{repo_name}"
+                repo_name = raw["repository_url"].rsplit("/", 1)[-1]
+                by_repo.setdefault(repo_name, []).append(
+                    {
+                        "number": raw["number"],
+                        "url": raw.get("pull_request", {}).get("url") or raw["url"],
+                        "html_url": raw["html_url"],
+                        "title": raw["title"],
+                        "body": raw.get("body") or "",
+                        "state": raw["state"],
+                        "draft": raw.get("draft", False),
+                        "head": {"ref": None, "sha": None},
+                        "base": {"ref": None, "sha": None},
+                        "created_at": raw.get("created_at"),
+                        "updated_at": raw.get("updated_at"),
+                        "user": {"login": (raw.get("user") or {}).get("login")},
+                    }
+                )
+        except GithubException as e:
+            logger.error(f"GitHub error prefetching pull requests for {owner}: {e}")
             if e.status == 401:
-                return None, "Authentication failed. Please check your GitHub api_key."
-            raise
+                return {
+                    "success": False,
+                    "error": "Authentication failed. Please check your GitHub token.",
+                    "error_type": "authentication_error",
+                }
+            elif e.status == 403:
+                return {
+                    "success": False,
+                    "error": f"Permission denied searching pull requests for {owner}",
+                    "error_type": "permission_error",
+                }
+            else:
+                return {
+                    "success": False,
+                    "error": f"GitHub error: {str(e)}",
+                    "error_type": "github_error",
+                }
 
-        return github_client, None
+        total_prs = 0
+        for repo_name, prs in by_repo.items():
+            cache_key = (owner, repo_name, state, "created", "desc", 30, 1, False)
+            _PR_LIST_CACHE.set(
+                cache_key,
+                {
+                    "success": True,
+                    "pull_requests": prs[:30],
+                    "total_count": len(prs),
+                },
+            )
+            total_prs += len(prs)
+
+        logger.info(
+            f"Prefetched {total_prs} pull requests across {len(by_repo)} repositories for {owner}"
+        )
+        return {
+            "success": True,
+            "repositories": len(by_repo),
+            "pull_requests": total_prs,
+        }
 
     except Exception as e:
-        logger.error(f"Failed to create GitHub client: {e}")
-        return None, f"Failed to create GitHub client: {str(e)}"
+        logger.error(f"Unexpected error prefetching pull requests: {e}")
+        return {
+            "success": False,
+            "error": f"Unexpected error: {str(e)}",
+            "error_type": "unknown",
+        }
 
 
 def list_github_pull_requests(
@@ -63,6 +491,7 @@ def list_github_pull_requests(
     direction: str = "desc",
     per_page: int = 30,
     page: int = 1,
+    include_total: bool = False,
 ) -> Dict[str, Any]:
     """
     List GitHub pull requests from a repository.
@@ -74,6 +503,8 @@ def list_github_pull_requests(
         direction: Sort direction - "asc" or "desc" (default: "desc")
         per_page: Number of results per page (default: 30, max: 100)
         page: Page number of results to fetch (default: 1)
+        include_total: Also fetch the total PR count; costs an extra API
+            round trip and the API caps the figure at 1000 (default: False)
 
     Returns:
         dict with keys:
@@ -88,7 +519,7 @@ def list_github_pull_requests(
                 - created_at: timestamp
                 - updated_at: timestamp
                 - user: dict with login
-            - total_count: int (total number of PRs matching the query)
+            - total_count: int if include_total=True, else None
             - error: str (if success=False)
             - error_type: str (if success=False)
 
@@ -108,11 +539,11 @@ def list_github_pull_requests(
         validation_errors = []
         if not repo or not repo.strip():
             validation_errors.append("Repository is required")
-        if state not in ["open", "closed", "all"]:
+        if state not in _VALID_STATES:
             validation_errors.append("State must be 'open', 'closed', or 'all'")
-        if sort not in ["created", "updated", "popularity", "long-running"]:
+        if sort not in _VALID_SORTS:
             validation_errors.append("Sort must be 'created', 'updated', 'popularity', or 'long-running'")
-        if direction not in ["asc", "desc"]:
+        if direction not in _VALID_DIRECTIONS:
             validation_errors.append("Direction must be 'asc' or 'desc'")
         if not isinstance(per_page, int) or per_page < 1 or per_page > 100:
             validation_errors.append("Per page must be an integer between 1 and 100")
@@ -120,72 +551,23 @@ def list_github_pull_requests(
             validation_errors.append("Page must be a positive integer")
 
         if validation_errors:
-            return {
-                "success": False,
-                "error": "; ".join(validation_errors),
-                "error_type": "validation_error",
-            }
-
-        # Get GitHub client
-        github_client, error = _get_github_client()
-        if error:
-            return {
-                "success": False,
-                "error": error,
-                "error_type": "configuration_error",
-            }
+            return _validation_error(validation_errors)
 
         # Parse repository specification
-        config = AssistantConfig()
-        if "/" in repo:
-            # Explicit owner/repo format
-            owner, repo_name = repo.split("/", 1)
-        else:
-            # Use default owner from config
-            default_owner = config.get_option("github", "default_owner")
-            if not default_owner:
-                return {
-                    "success": False,
-                    "error": (
-                        f"Repository '{repo}' is missing owner. Either provide "
-                        "'owner/repo' format or configure 'default_owner' in "
-                        "[github] section of .fsc-assistant.env.toml"
-                    ),
-                    "error_type": "validation_error",
-                }
-            owner = default_owner
-            repo_name = repo
+        owner, repo_name, parse_error = _parse_repo(repo)
+        if parse_error:
+            return parse_error
 
-        # Get repository object
-        try:
-            repository = github_client.get_repo(f"{owner}/{repo_name}")
-        except GithubException as e:
-            logger.error(f"GitHub error accessing repository {owner}/{repo_name}: {e}")
+        # Serve recent identical queries from the TTL cache
+        cache_key = (owner, repo_name, state, sort, direction, per_page, page, include_total)
+        cached = _PR_LIST_CACHE.get(cache_key)
+        if cached is not None:
+            return cached
 
-            if e.status == 404:
-                return {
-                    "success": False,
-                    "error": f"Repository not found: {owner}/{repo_name}",
-                    "error_type": "repository_not_found",
-                }
-            elif e.status == 401:
-                return {
-                    "success": False,
-                    "error": "Authentication failed. Please check your GitHub token.",
-                    "error_type": "authentication_error",
-                }
-            elif e.status == 403:
-                return {
-                    "success": False,
-                    "error": f"Permission denied for repository: {owner}/{repo_name}",
-                    "error_type": "permission_error",
-                }
-            else:
-                return {
-                    "success": False,
-                    "error": f"GitHub error: {str(e)}",
-                    "error_type": "github_error",
-                }
+        # Get repository object
+        repository, repo_error = _resolve_repository(owner, repo_name, per_page=per_page)
+        if repo_error:
+            return repo_error
 
         # Get pull requests
         try:
@@ -193,33 +575,18 @@ def list_github_pull_requests(
                 state=state, sort=sort, direction=direction
             )
 
-            # Apply pagination
-            total_count = pulls.totalCount
-            start_index = (page - 1) * per_page
-            end_index = start_index + per_page
-
-            # Get the paginated results
-            paginated_pulls = []
-            for i in range(start_index, min(end_index, total_count)):
-                try:
-                    pr = pulls[i]
-                    pr_data = {
-                        "number": pr.number,
-                        "url": pr.url,
-                        "html_url": pr.html_url,
-                        "title": pr.title,
-                        "body": pr.body or "",
-                        "state": pr.state,
-                        "draft": pr.draft,
-                        "head": {"ref": pr.head.ref, "sha": pr.head.sha},
-                        "base": {"ref": pr.base.ref, "sha": pr.base.sha},
-                        "created_at": pr.created_at.isoformat() if pr.created_at else None,
-                        "updated_at": pr.updated_at.isoformat() if pr.updated_at else None,
-                        "user": {"login": pr.user.login if pr.user else None},
-                    }
-                    paginated_pulls.append(pr_data)
-                except IndexError:
-                    break
+            # Fetch exactly the requested page in one API call; totalCount
+            # costs an extra round trip, so only compute it on request.
+            total_count = pulls.totalCount if include_total else None
+            page_items = _with_rate_limit_retry(lambda: pulls.get_page(page - 1))[:per_page]
+
+            # raw_data is normally complete after get_page, but any residual
+            # lazy hydration fetches overlap instead of running one at a time.
+            if page_items:
+                with ThreadPoolExecutor(max_workers=min(len(page_items), 16)) as executor:
+                    paginated_pulls = list(executor.map(_build_pr_dict, page_items))
+            else:
+                paginated_pulls = []
 
             logger.info(
                 f"Successfully retrieved {len(paginated_pulls)} pull requests from {owner}/{repo_name} "
@@ -248,11 +615,13 @@ def list_github_pull_requests(
                     "error_type": "github_error",
                 }
 
-        return {
+        result = {
             "success": True,
             "pull_requests": paginated_pulls,
             "total_count": total_count,
         }
+        _PR_LIST_CACHE.set(cache_key, result)
+        return result
 
     except Exception as e:
         logger.error(f"Unexpected error listing pull requests: {e}")
@@ -303,72 +672,17 @@ def close_github_pull_request(repo: str, pr_number: int) -> Dict[str, Any]:
             validation_errors.append("Pull request number must be a positive integer")
 
         if validation_errors:
-            return {
-                "success": False,
-                "error": "; ".join(validation_errors),
-                "error_type": "validation_error",
-            }
-
-        # Get GitHub client
-        github_client, error = _get_github_client()
-        if error:
-            return {
-                "success": False,
-                "error": error,
-                "error_type": "configuration_error",
-            }
+            return _validation_error(validation_errors)
 
         # Parse repository specification
-        config = AssistantConfig()
-        if "/" in repo:
-            # Explicit owner/repo format
-            owner, repo_name = repo.split("/", 1)
-        else:
-            # Use default owner from config
-            default_owner = config.get_option("github", "default_owner")
-            if not default_owner:
-                return {
-                    "success": False,
-                    "error": (
-                        f"Repository '{repo}' is missing owner. Either provide "
-                        "'owner/repo' format or configure 'default_owner' in "
-                        "[github] section of .fsc-assistant.env.toml"
-                    ),
-                    "error_type": "validation_error",
-                }
-            owner = default_owner
-            repo_name = repo
+        owner, repo_name, parse_error = _parse_repo(repo)
+        if parse_error:
+            return parse_error
 
         # Get repository object
-        try:
-            repository = github_client.get_repo(f"{owner}/{repo_name}")
-        except GithubException as e:
-            logger.error(f"GitHub error accessing repository {owner}/{repo_name}: {e}")
-
-            if e.status == 404:
-                return {
-                    "success": False,
-                    "error": f"Repository not found: {owner}/{repo_name}",
-                    "error_type": "repository_not_found",
-                }
-            elif e.status == 401:
-                return {
-                    "success": False,
-                    "error": "Authentication failed. Please check your GitHub token.",
-                    "error_type": "authentication_error",
-                }
-            elif e.status == 403:
-                return {
-                    "success": False,
-                    "error": f"Permission denied for repository: {owner}/{repo_name}",
-                    "error_type": "permission_error",
-                }
-            else:
-                return {
-                    "success": False,
-                    "error": f"GitHub error: {str(e)}",
-                    "error_type": "github_error",
-                }
+        repository, repo_error = _resolve_repository(owner, repo_name)
+        if repo_error:
+            return repo_error
 
         # Get the pull request
         try:
@@ -399,10 +713,10 @@ def close_github_pull_request(repo: str, pr_number: int) -> Dict[str, Any]:
                     "error_type": "github_error",
                 }
 
-        # Close the pull request
+        # Close the pull request; edit() mutates the object in place
         try:
-            closed_pr = pr.edit(state="closed")
-            
+            _with_rate_limit_retry(lambda: pr.edit(state="closed"))
+
             logger.info(
                 f"Successfully closed pull request #{pr_number} in {owner}/{repo_name}"
             )
@@ -423,20 +737,13 @@ def close_github_pull_request(repo: str, pr_number: int) -> Dict[str, Any]:
                     "error_type": "github_error",
                 }
 
-        # Build response with PR details
-        pr_data = {
-            "number": closed_pr.number,
-            "url": closed_pr.url,
-            "html_url": closed_pr.html_url,
-            "title": closed_pr.title,
-            "body": closed_pr.body or "",
-            "state": closed_pr.state,
-            "draft": closed_pr.draft,
-            "head": {"ref": closed_pr.head.ref, "sha": closed_pr.head.sha},
-            "base": {"ref": closed_pr.base.ref, "sha": closed_pr.base.sha},
-            "created_at": closed_pr.created_at.isoformat() if closed_pr.created_at else None,
-            "user": {"login": closed_pr.user.login if closed_pr.user else None},
-        }
+        # Build response with PR details. edit() updates the object's
+        # attributes but not raw_data, so overlay the fields the PATCH
+        # changed; otherwise the response would still say "open".
+        pr_data = _build_pr_dict(pr)
+        pr_data["state"] = pr.state
+        if pr.updated_at is not None:
+            pr_data["updated_at"] = pr.updated_at.strftime("%Y-%m-%dT%H:%M:%SZ")
 
         return {"success": True, "pull_request": pr_data}
 
@@ -511,111 +818,54 @@ def create_github_pull_request(
             validation_errors.append("Head branch is required")
 
         if validation_errors:
-            return {
-                "success": False,
-                "error": "; ".join(validation_errors),
-                "error_type": "validation_error",
-            }
-
-        # Get GitHub client
-        github_client, error = _get_github_client()
-        if error:
-            return {
-                "success": False,
-                "error": error,
-                "error_type": "configuration_error",
-            }
+            return _validation_error(validation_errors)
 
         # Parse repository specification
-        config = AssistantConfig()
-        if "/" in repo:
-            # Explicit owner/repo format
-            owner, repo_name = repo.split("/", 1)
-        else:
-            # Use default owner from config
-            default_owner = config.get_option("github", "default_owner")
-            if not default_owner:
-                return {
-                    "success": False,
-                    "error": (
-                        f"Repository '{repo}' is missing owner. Either provide "
-                        "'owner/repo' format or configure 'default_owner' in "
-                        "[github] section of .fsc-assistant.env.toml"
-                    ),
-                    "error_type": "validation_error",
-                }
-            owner = default_owner
-            repo_name = repo
+        owner, repo_name, parse_error = _parse_repo(repo)
+        if parse_error:
+            return parse_error
 
         # Get repository object
-        try:
-            repository = github_client.get_repo(f"{owner}/{repo_name}")
-        except GithubException as e:
-            logger.error(f"GitHub error accessing repository {owner}/{repo_name}: {e}")
-
-            if e.status == 404:
-                return {
-                    "success": False,
-                    "error": f"Repository not found: {owner}/{repo_name}",
-                    "error_type": "repository_not_found",
-                }
-            elif e.status == 401:
-                return {
-                    "success": False,
-                    "error": "Authentication failed. Please check your GitHub token.",
-                    "error_type": "authentication_error",
-                }
-            elif e.status == 403:
-                return {
-                    "success": False,
-                    "error": f"Permission denied for repository: {owner}/{repo_name}",
-                    "error_type": "permission_error",
-                }
-            else:
-                return {
-                    "success": False,
-                    "error": f"GitHub error: {str(e)}",
-                    "error_type": "github_error",
-                }
-
-        # Validate head branch exists
-        try:
-            repository.get_branch(head)
-        except GithubException as e:
-            if e.status == 404:
-                return {
-                    "success": False,
-                    "error": f"Head branch not found: {head}",
-                    "error_type": "branch_not_found",
-                }
-            else:
-                return {
-                    "success": False,
-                    "error": f"Error checking head branch: {str(e)}",
-                    "error_type": "github_error",
-                }
-
-        # Validate base branch exists
-        try:
-            repository.get_branch(base)
-        except GithubException as e:
-            if e.status == 404:
-                return {
-                    "success": False,
-                    "error": f"Base branch not found: {base}",
-                    "error_type": "branch_not_found",
-                }
-            else:
-                return {
-                    "success": False,
-                    "error": f"Error checking base branch: {str(e)}",
-                    "error_type": "github_error",
-                }
+        repository, repo_error = _resolve_repository(owner, repo_name)
+        if repo_error:
+            return repo_error
+
+        # Validate head and base branches concurrently; the two lookups are
+        # independent, so overlapping them costs one round trip instead of two.
+        def _check_branch(branch_name: str) -> Optional[GithubException]:
+            try:
+                repository.get_branch(branch_name)
+                return None
+            except GithubException as branch_err:
+                return branch_err
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            head_error, base_error = executor.map(_check_branch, [head, base])
+
+        for label, branch_name, branch_error in (
+            ("Head", head, head_error),
+            ("Base", base, base_error),
+        ):
+            if branch_error is not None:
+                if branch_error.status == 404:
+                    return {
+                        "success": False,
+                        "error": f"{label} branch not found: {branch_name}",
+                        "error_type": "branch_not_found",
+                    }
+                else:
+                    return {
+                        "success": False,
+                        "error": f"Error checking {label.lower()} branch: {str(branch_error)}",
+                        "error_type": "github_error",
+                    }
 
         # Create pull request
         try:
-            pr = repository.create_pull(
-                title=title, body=body, head=head, base=base, draft=draft
+            pr = _with_rate_limit_retry(
+                lambda: repository.create_pull(
+                    title=title, body=body, head=head, base=base, draft=draft
+                )
             )
 
             logger.info(
@@ -652,19 +902,7 @@ def create_github_pull_request(
                 }
 
         # Build response with PR details
-        pr_data = {
-            "number": pr.number,
-            "url": pr.url,
-            "html_url": pr.html_url,
-            "title": pr.title,
-            "body": pr.body or "",
-            "state": pr.state,
-            "draft": pr.draft,
-            "head": {"ref": pr.head.ref, "sha": pr.head.sha},
-            "base": {"ref": pr.base.ref, "sha": pr.base.sha},
-            "created_at": pr.created_at.isoformat() if pr.created_at else None,
-            "user": {"login": pr.user.login if pr.user else None},
-        }
+        pr_data = _build_pr_dict(pr)
 
         return {"success": True, "pull_request": pr_data}
 
@@ -72,6 +72,23 @@ class AgenticShell:
         self._selected_model = None
         self._cached_tools = None
         self.last_command_output = None
+        # Cache of prompt/template file contents keyed by path, validated
+        # against the file's mtime so edits are still picked up.
+        self._prompt_file_cache = {}
+
+        # O(1) dispatch table for exact commands; keys are
+        # whitespace-normalized lowercase command strings.
+        self._command_handlers = {}
+        for name in const.CLEAR_HISTORY_COMMANDS:
+            self._command_handlers[name] = self._clear_history
+        for name in const.SAVE_HISTORY_COMMANDS:
+            self._command_handlers[name] = self._save_history
+        for name in const.SHOW_HISTORY_COMMANDS:
+            self._command_handlers[name] = self._show_history
+        for name in const.MCP_STATUS_COMMANDS:
+            self._command_handlers[name] = self._show_mcp_status
+        for name in const.ANALYZE_COMMANDS:
+            self._command_handlers[name] = self._analyze_last_output
     
     # lambda x: print(x, end="", flush=True),
     @property
@@ -198,8 +215,30 @@ class AgenticShell:
         ])
         if intent == Intent.UNKNOWN or has_agent is False:
             return  CODING_ASSISTANT_SYSTEM_PROMPT
-        
-        return agent_md.read_text(encoding="UTF-8")        
+
+        return self._read_prompt_file(agent_md)
+
+    def _read_prompt_file(self, path: Path) -> str:
+        """
+        Read a prompt or template file, caching contents across turns.
+
+        The cache entry is invalidated when the file's mtime changes, so
+        edits to AGENTS.md or prompt templates are picked up without
+        restarting the shell.
+
+        Args:
+            path: Path of the prompt file to read
+
+        Returns:
+            File contents as text
+        """
+        mtime = path.stat().st_mtime
+        cached = self._prompt_file_cache.get(path)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+        content = path.read_text(encoding="UTF-8")
+        self._prompt_file_cache[path] = (mtime, content)
+        return content
 
 
     def _get_tools(self, user_input: str) -> List:
@@ -233,7 +272,6 @@ class AgenticShell:
         Returns:
             Refined prompt, potentially with template applied
         """
-        intent = analyze_user_intent(user_input or "")
         refined_prompt = user_input
         prompt_template = None
         if user_input.startswith("/openspec"):
@@ -258,7 +296,7 @@ class AgenticShell:
         if prompt_template:
             prompt_path = get_project_root() / const.PROMPTS_DIR / prompt_template
             if prompt_path.exists() and prompt_path.is_file():
-                template_content = prompt_path.read_text(encoding="UTF-8")
+                template_content = self._read_prompt_file(prompt_path)
                 refined_prompt = template_content.replace("$ARGUMENTS", user_input)
                 
         return refined_prompt
@@ -305,6 +343,29 @@ class AgenticShell:
         for hist in hists:
             self.console.print(hist.get("content", ""))
 
+    def _clear_history(self) -> None:
+        """Clear the conversation history and start a new chat."""
+        self.llm.chat_history.clear_history()
+
+    def _save_history(self) -> None:
+        """Persist the conversation history to disk."""
+        self.llm.chat_history.save_history()
+
+    def _show_mcp_status(self) -> None:
+        """Display MCP server status (placeholder)."""
+
+    def _analyze_last_output(self) -> None:
+        """Send the most recent command output to the LLM for analysis."""
+        if self.last_command_output is None:
+            self.cliconsole.print("No command output available for analysis.", color="yellow")
+            return
+        # Prepare prompt with captured output
+        analysis_prompt = f"Analyze the following shell command output:\n\n{json.dumps(self.last_command_output, indent=2)}\n\nProvide insights and next steps."
+        # Call LLM analysis using existing workflow
+        response = self.run_workflow(analysis_prompt)
+        if response:
+            self.console.print(Panel(Markdown(response), title="AI Analysis"))
+
     def process_command(self, command: str) -> Optional[bool]:
         """
         Process special shell commands.
@@ -361,7 +422,7 @@ class AgenticShell:
 
         # Clear screen
         if command_lower == "clear":
-            os.system("clear" if os.name == "posix" else "cls")
+            self.console.clear()
             self.display_welcome()
             return True
 
@@ -370,36 +431,10 @@ class AgenticShell:
             self._show_help()
             return True
 
-        # History management
-        if const.PATTERN_CLEAR_HISTORY.search(
-            command_lower
-        ) or const.PATTERN_NEW_CHAT.search(command_lower):
-            self.llm.chat_history.clear_history()
-            return True
-
-        if const.PATTERN_SAVE_HISTORY.search(command_lower):
-            self.llm.chat_history.save_history()
-            return True
-
-        if const.PATTERN_SHOW_HISTORY.search(command_lower):
-            self._show_history()
-            return True
-
-        # MCP status (placeholder)
-        if const.PATTERN_MCP_STATUS.search(command_lower):
-            return True
-            
-        # Ask AI command
-        if const.PATTERN_ASK_AI.search(command_lower) or const.PATTERN_ANALYZE.search(command_lower):
-            if self.last_command_output is None:
-                self.cliconsole.print("No command output available for analysis.", color="yellow")
-                return True            
-            # Prepare prompt with captured output
-            analysis_prompt = f"Analyze the following shell command output:\n\n{json.dumps(self.last_command_output, indent=2)}\n\nProvide insights and next steps."            
-            # Call LLM analysis using existing workflow
-            response = self.run_workflow(analysis_prompt)
-            if response:
-                self.console.print(Panel(Markdown(response), title="AI Analysis"))
+        # Exact commands (history management, MCP status, AI analysis)
+        handler = self._command_handlers.get(" ".join(command_lower.split()))
+        if handler is not None:
+            handler()
             return True
 
         return None
@@ -5,8 +5,7 @@ This module contains all magic strings, file extensions, command patterns,
 and UI messages used by the AgenticShell class.
 """
 
-import re
-from typing import List, Pattern
+from typing import List
 
 # Document file extensions
 DOCUMENT_EXTENSIONS: List[str] = [
@@ -39,14 +38,12 @@ DOCUMENT_EXTRACTION_KEYWORDS: List[str] = [
 EXIT_COMMANDS: List[str] = ["exit", "quit", "q", "bye"]
 HELP_COMMANDS: List[str] = ["help", "?"]
 
-# Command patterns (compiled regex)
-PATTERN_CLEAR_HISTORY: Pattern = re.compile(r"^clear\s*history$")
-PATTERN_NEW_CHAT: Pattern = re.compile(r"new(\s*chat)?$")
-PATTERN_SAVE_HISTORY: Pattern = re.compile(r"^save\s*history$")
-PATTERN_SHOW_HISTORY: Pattern = re.compile(r"^show\s*history$")
-PATTERN_MCP_STATUS: Pattern = re.compile(r"^mcp\s*status$")
-PATTERN_ASK_AI: Pattern = re.compile(r"^ask\s*ai$")
-PATTERN_ANALYZE: Pattern = re.compile(r"^analyze$")
+# Canonical command names (whitespace-normalized before lookup)
+CLEAR_HISTORY_COMMANDS: List[str] = ["clear history", "clearhistory", "new", "new chat", "newchat"]
+SAVE_HISTORY_COMMANDS: List[str] = ["save history", "savehistory"]
+SHOW_HISTORY_COMMANDS: List[str] = ["show history", "showhistory"]
+MCP_STATUS_COMMANDS: List[str] = ["mcp status", "mcpstatus"]
+ANALYZE_COMMANDS: List[str] = ["ask ai", "askai", "analyze"]
 # OpenSpec command prefixes
 OPENSPEC_PROPOSAL_PREFIXES: List[str] = ["/openspec-proposal", "/openspec:proposal"]
 OPENSPEC_APPLY_PREFIXES: List[str] = ["/openspec-apply", "/openspec:apply"]
@@ -13,18 +13,19 @@ from .system_shell_daemon import (
     check_daemon_status,
     setup_signal_handlers
 )
-from .file_system import *
-from .text_file import *
-from .binary_file import *
-from .project import *
-from .time import *
+from .file_system import change_working_directory
+from .text_file import load_text_file_from_disk, save_text_file_to_disk
+from .binary_file import load_image_files_from_disk, save_binary_file_to_disk
+from .project import get_current_project_root_folder, list_files_in_current_project
+from .time import get_current_local_time
+
 # Export all tools for easy access
-__all__ = [
+__all__ = (
     'get_current_local_time',
     # System shell tools
     'run_shell_command',
     'run_shell_command_daemon',
-    'list_daemon_processes', 
+    'list_daemon_processes',
     'terminate_daemon_process',
     'check_daemon_status',
     'setup_signal_handlers',
@@ -38,5 +39,5 @@ __all__ = [
     'save_binary_file_to_disk',
     # Project tools
     'get_current_project_root_folder',
-    'list_files_in_current_project'
-]
\ No newline at end of file
+    'list_files_in_current_project',
+)
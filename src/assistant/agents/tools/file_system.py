@@ -1,4 +1,5 @@
 import os
+import stat
 import logging
 
 logger = logging.getLogger(__name__)
@@ -19,22 +20,33 @@ def change_working_directory(target_path: str) -> str:
         # Resolve the path to absolute form for consistency
         abs_target_path = os.path.abspath(target_path)
         
-        # Check if the path exists and is a directory
-        if not os.path.exists(abs_target_path):
+        # One stat answers both existence and file-type; os.path.exists +
+        # os.path.isdir would stat the same path twice
+        try:
+            st = os.stat(abs_target_path)
+        except FileNotFoundError:
             return f"Error: Directory '{abs_target_path}' does not exist."
-            
-        if not os.path.isdir(abs_target_path):
+
+        if not stat.S_ISDIR(st.st_mode):
             return f"Error: Path '{abs_target_path}' is not a directory."
-        
+
         # Check permissions - try to access the directory
         if not os.access(abs_target_path, os.R_OK | os.X_OK):
             return f"Error: Permission denied accessing directory '{abs_target_path}'."
-            
+
         # Change working directory
-        old_cwd = os.getcwd()
+        if logger.isEnabledFor(logging.DEBUG):
+            old_cwd = os.getcwd()
         os.chdir(abs_target_path)
-        
-        logger.debug(f"Changed working directory from {old_cwd} to {abs_target_path}")
+
+        # Project-root lookups are memoized per cwd; invalidate them now
+        # that the cwd has changed.
+        from assistant.agents.tools.project import _cached_project_root
+
+        _cached_project_root.cache_clear()
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Changed working directory from {old_cwd} to {abs_target_path}")
         return f"Successfully changed working directory to {abs_target_path}"
         
     except Exception as e:
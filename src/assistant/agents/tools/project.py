@@ -1,13 +1,48 @@
 import logging
+import os
+from functools import lru_cache
+from io import StringIO
 from pathlib import Path
 from assistant.utils.path import get_project_root
 
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=64)
+def _cached_project_root(cwd_str: str) -> Path:
+    """Resolve the project root for a working directory, memoized per cwd.
+
+    Walking parent directories for project markers costs O(depth) stat
+    calls; repeated tool calls from the same cwd hit the cache instead.
+    ``change_working_directory`` clears this cache after a successful chdir.
+    """
+    return get_project_root(Path(cwd_str))
+
+
+def _walk_project(root: str):
+    """Yield project file paths relative to root, skipping hidden entries.
+
+    Uses an explicit stack of os.scandir calls instead of ``Path.rglob`` so
+    directory-entry metadata is reused (no extra ``stat`` per file) and
+    hidden directories are pruned before descending into them. Yielding
+    lets callers stream entries without materializing the whole listing.
+    """
+    stack = [root]
+    while stack:
+        current = stack.pop()
+        with os.scandir(current) as entries:
+            for entry in entries:
+                if entry.name.startswith("."):
+                    continue
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.is_file(follow_symlinks=False):
+                    yield os.path.relpath(entry.path, root)
+
+
 def get_current_project_root_folder() -> str:
     """get current project root directory"""
-    file_path = get_project_root(Path.cwd())
+    file_path = _cached_project_root(os.getcwd())
     file_path_str = str(file_path)
     print(f"Current project root folder: {file_path_str}")
     return file_path_str
@@ -15,9 +50,9 @@ def get_current_project_root_folder() -> str:
 
 def list_files_in_current_project() -> str:
     """list all files in current project"""
-    files = []
-    proj_root = get_project_root()
-    for file_path in proj_root.rglob("*"):
-        if file_path.is_file() and not file_path.name.startswith("."):
-            files.append(str(file_path.relative_to(proj_root)))
-    return "\n".join(files)
+    proj_root = _cached_project_root(os.getcwd())
+    buf = StringIO()
+    for rel_path in _walk_project(str(proj_root)):
+        buf.write(rel_path)
+        buf.write("\n")
+    return buf.getvalue().rstrip("\n")
@@ -1,43 +1,360 @@
+import functools
+import heapq
+import logging
 import os
 import re
+import select
+import selectors
 import signal
 import subprocess
 import threading
 import time
+from collections import deque
 from datetime import datetime
-from typing import Dict, List
+from typing import Dict, List, Optional
 from assistant.utils.cli.executor import (
     execute_command_realtime_combined,
     execute_command_interactive,
 )
 
+logger = logging.getLogger(__name__)
+
 # Global registry to track daemon processes
 _daemon_processes: Dict[int, dict] = {}
 _process_lock = threading.Lock()
 
+# Terminated pids in termination order, so expiry pops from the front
+# instead of rescanning the whole registry
+_terminated_queue: "deque[tuple[float, int]]" = deque()
+
+# How long terminated entries stay queryable before eviction
+_TERMINATED_RETENTION_SECONDS = 300
+
+# Shared spawn signatures: partial freezes the common kwargs once instead
+# of rebuilding the same kwargs dict on every call
+_RUN = functools.partial(
+    subprocess.run,
+    shell=True,
+    stdout=subprocess.PIPE,
+    stderr=subprocess.STDOUT,
+    text=True,
+)
+_POPEN_DAEMON = functools.partial(
+    subprocess.Popen,
+    shell=True,
+    stdout=subprocess.PIPE,
+    stderr=subprocess.PIPE,
+    text=True,
+    # New session/process group isolates the daemon from terminal signals;
+    # start_new_session runs setsid() in C between fork and exec instead of
+    # re-entering the interpreter via preexec_fn (which is documented as
+    # unsafe with threads)
+    start_new_session=True,
+)
+
+
+def _mark_terminated(pid: int, info: dict) -> None:
+    """Record a termination; caller must hold _process_lock."""
+    info["status"] = "terminated"
+    info["end_time"] = time.monotonic()
+    _terminated_queue.append((info["end_time"], pid))
+
+# pidfd-based reaping is Linux-only (Python 3.9+); elsewhere we fall back
+# to one watchdog thread per timed daemon.
+_HAS_PIDFD = hasattr(os, "pidfd_open") and hasattr(select, "epoll")
+
+
+class _PipeReader:
+    """Single selector thread that drains every daemon's stdout/stderr.
+
+    A daemon whose pipes nobody reads blocks as soon as the 64KB kernel
+    buffer fills — dev servers hang silently after a few seconds of logs.
+    One shared selector loop fans all daemon pipes into a bounded deque per
+    process, so N children cost one thread and the recent output stays
+    available via get_daemon_output().
+    """
+
+    def __init__(self):
+        self._sel = selectors.DefaultSelector()
+        self._lock = threading.Lock()
+        self._thread = threading.Thread(
+            target=self._run, name="daemon-pipe-reader", daemon=True
+        )
+        self._thread.start()
+
+    def register(self, pid: int, stream) -> None:
+        fd = stream.fileno()
+        os.set_blocking(fd, False)
+        with self._lock:
+            self._sel.register(fd, selectors.EVENT_READ, pid)
+
+    def detach(self, stream) -> List[str]:
+        """Stop watching the stream; return any undrained output.
+
+        The leftover chunks are returned rather than appended to the
+        registry here: callers typically already hold _process_lock, and
+        appending would re-acquire it (self-deadlock) while taking the
+        selector lock on top of it would invert the lock order against
+        _append. Nothing but the selector lock is taken on this path.
+        """
+        try:
+            fd = stream.fileno()
+        except ValueError:
+            return []
+        with self._lock:
+            try:
+                self._sel.unregister(fd)
+            except KeyError:
+                return []
+        return self._drain(fd)
+
+    @staticmethod
+    def _drain(fd: int) -> List[str]:
+        chunks = []
+        try:
+            while True:
+                chunk = os.read(fd, 65536)
+                if not chunk:
+                    break
+                chunks.append(chunk.decode("utf-8", errors="replace"))
+        except (BlockingIOError, OSError):
+            pass
+        return chunks
+
+    @staticmethod
+    def _append(pid: int, chunk: bytes) -> None:
+        with _process_lock:
+            info = _daemon_processes.get(pid)
+            if info is not None:
+                info["output"].append(chunk.decode("utf-8", errors="replace"))
+
+    def _run(self):
+        while True:
+            # Short-interval polling keeps registration/teardown races
+            # harmless without a wakeup pipe
+            events = self._sel.select(timeout=0.5)
+            for key, _ in events:
+                try:
+                    chunk = os.read(key.fd, 65536)
+                except (BlockingIOError, InterruptedError):
+                    continue
+                except OSError:
+                    chunk = b""
+                if chunk:
+                    self._append(key.data, chunk)
+                else:
+                    with self._lock:
+                        try:
+                            self._sel.unregister(key.fd)
+                        except KeyError:
+                            pass
+
+
+_pipe_reader: Optional[_PipeReader] = None
+_pipe_reader_lock = threading.Lock()
+
+
+def _get_pipe_reader() -> _PipeReader:
+    global _pipe_reader
+    if _pipe_reader is None:
+        with _pipe_reader_lock:
+            if _pipe_reader is None:
+                _pipe_reader = _PipeReader()
+    return _pipe_reader
+
+
+def get_daemon_output(pid: int) -> str:
+    """Return the buffered recent output of a daemon process."""
+    with _process_lock:
+        info = _daemon_processes.get(pid)
+        if info is None:
+            return ""
+        return "".join(info.get("output") or ())
+
+
+def _release_process(info: dict, exit_code: Optional[int]) -> None:
+    """Close a reaped daemon's pipes and sync its Popen bookkeeping.
+
+    Caller must hold _process_lock; detach() hands back the last unread
+    pipe chunks and they are folded into the output buffer directly here
+    rather than through _append, which would try to take the registry
+    lock again.
+
+    Without this every spawned daemon leaks its stdout/stderr pipe fds for
+    the life of the assistant, and children that were never waited on
+    linger as kernel zombies.
+    """
+    proc = info.get("proc")
+    if proc is None:
+        return
+    if proc.returncode is None:
+        # The child was reaped via waitid; record the code so Popen's
+        # destructor does not try to wait again
+        proc.returncode = exit_code if exit_code is not None else 0
+    reader = _pipe_reader
+    output = info.get("output")
+    for stream in (proc.stdout, proc.stderr):
+        if stream is not None:
+            if reader is not None:
+                for chunk in reader.detach(stream):
+                    if output is not None:
+                        output.append(chunk)
+            try:
+                stream.close()
+            except OSError:
+                pass
+
+
+class _Reaper:
+    """Single event-driven thread that watches every daemon process.
+
+    Each daemon contributes one pidfd registered with a shared epoll, so N
+    background commands cost one waiting thread instead of N sleeping
+    watchdog threads. Timeouts are tracked in a deadline heap that bounds
+    the epoll wait, so SIGTERM fires when the deadline passes rather than
+    when a sleep() happens to wake.
+    """
+
+    def __init__(self):
+        self._epoll = select.epoll()
+        self._pidfds: Dict[int, int] = {}  # pidfd -> pid
+        self._deadlines: list = []  # heap of (deadline, pid)
+        # Self-pipe so watch() can interrupt an in-flight epoll wait
+        self._wake_r, self._wake_w = os.pipe()
+        os.set_blocking(self._wake_r, False)
+        self._epoll.register(self._wake_r, select.EPOLLIN)
+        self._lock = threading.Lock()
+        self._thread = threading.Thread(
+            target=self._run, name="daemon-reaper", daemon=True
+        )
+        self._thread.start()
+
+    def watch(self, pid: int, pidfd: int, deadline: Optional[float]) -> None:
+        """Register a daemon's pidfd and optional monotonic deadline."""
+        with self._lock:
+            self._pidfds[pidfd] = pid
+            self._epoll.register(pidfd, select.EPOLLIN)
+            if deadline is not None:
+                heapq.heappush(self._deadlines, (deadline, pid, signal.SIGTERM))
+        os.write(self._wake_w, b"\x00")
+
+    def _run(self):
+        while True:
+            with self._lock:
+                if self._deadlines:
+                    wait = max(0.0, self._deadlines[0][0] - time.monotonic())
+                else:
+                    wait = -1
+            try:
+                events = self._epoll.poll(wait)
+            except InterruptedError:
+                continue
+            ready = []
+            for fd, _ in events:
+                if fd == self._wake_r:
+                    try:
+                        os.read(self._wake_r, 4096)
+                    except BlockingIOError:
+                        pass
+                else:
+                    ready.append(fd)
+            if ready:
+                self._on_exits(ready)
+            self._fire_deadlines()
+
+    def _on_exits(self, pidfds: List[int]) -> None:
+        """Reap every child whose pidfd became readable in this wakeup.
+
+        A burst of terminations is handled with one pass per lock: drop
+        all fds from the epoll set, reap each with a non-blocking waitid,
+        then record every exit under a single registry lock acquisition.
+        """
+        reaped = []
+        with self._lock:
+            for pidfd in pidfds:
+                pid = self._pidfds.pop(pidfd, None)
+                if pid is None:
+                    continue
+                self._epoll.unregister(pidfd)
+                reaped.append((pidfd, pid))
+        results = []
+        for pidfd, pid in reaped:
+            exit_code = None
+            try:
+                result = os.waitid(os.P_PIDFD, pidfd, os.WEXITED | os.WNOHANG)
+                if result is not None:
+                    exit_code = result.si_status
+            except (ChildProcessError, OSError):
+                pass
+            finally:
+                os.close(pidfd)
+            results.append((pid, exit_code))
+        with _process_lock:
+            for pid, exit_code in results:
+                info = _daemon_processes.get(pid)
+                if info is not None:
+                    if info["status"] != "terminated":
+                        _mark_terminated(pid, info)
+                    info["exit_code"] = exit_code
+                    _release_process(info, exit_code)
+
+    def _fire_deadlines(self) -> None:
+        now = time.monotonic()
+        expired = []
+        with self._lock:
+            while self._deadlines and self._deadlines[0][0] <= now:
+                expired.append(heapq.heappop(self._deadlines))
+        for deadline, pid, sig in expired:
+            with self._lock:
+                still_alive = pid in self._pidfds.values()
+            if not still_alive:
+                continue
+            try:
+                with _process_lock:
+                    info = _daemon_processes.get(pid)
+                    if info is None:
+                        continue
+                    os.killpg(os.getpgid(pid), sig)
+                    if info["status"] == "running":
+                        _mark_terminated(pid, info)
+            except Exception:
+                # Process might have already terminated
+                continue
+            if sig == signal.SIGTERM:
+                # Escalate if the group ignores SIGTERM; the pidfd event
+                # cancels this implicitly by draining _pidfds
+                with self._lock:
+                    heapq.heappush(
+                        self._deadlines, (deadline + 5.0, pid, signal.SIGKILL)
+                    )
+
+
+_reaper: Optional[_Reaper] = None
+_reaper_lock = threading.Lock()
+
+
+def _get_reaper() -> _Reaper:
+    global _reaper
+    if _reaper is None:
+        with _reaper_lock:
+            if _reaper is None:
+                _reaper = _Reaper()
+    return _reaper
+
 
 def _cleanup_terminated_processes():
-    """Clean up terminated processes from the registry."""
-    global _daemon_processes
+    """Clean up terminated processes from the registry.
+
+    Terminations are queued in order, so this pops expired entries off the
+    front of the queue — O(evicted) rather than a scan of every process.
+    """
+    cutoff = time.monotonic() - _TERMINATED_RETENTION_SECONDS
     with _process_lock:
-        current_time = time.time()
-        # Simple cleanup - remove processes that have been terminated for more than 5 minutes
-        expired_pids = [
-            pid
-            for pid, info in _daemon_processes.items()
-            if info.get("status") == "terminated"
-            and (
-                current_time
-                - (
-                    info.get("end_time", current_time).timestamp()
-                    if hasattr(info.get("end_time"), "timestamp")
-                    else info.get("end_time", current_time)
-                )
-            )
-            > 300
-        ]
-        for pid in expired_pids:
-            del _daemon_processes[pid]
+        while _terminated_queue and _terminated_queue[0][0] <= cutoff:
+            _, pid = _terminated_queue.popleft()
+            info = _daemon_processes.get(pid)
+            if info is not None and info.get("status") == "terminated":
+                del _daemon_processes[pid]
 
 
 def run_shell_command_daemon(command_string: str, timeout: int = 180) -> dict:
@@ -64,23 +381,18 @@ def run_shell_command_daemon(command_string: str, timeout: int = 180) -> dict:
         >>> result = run_shell_command_daemon("ping google.com", timeout=10)
     """
 
-    # Validate input parameters
-    if not isinstance(command_string, str):
-        raise TypeError("command_string must be a string")
+    # Validate input parameters (elided under python -O, like asserts; the
+    # subprocess layer still raises on genuinely bad arguments)
+    if __debug__:
+        if not isinstance(command_string, str):
+            raise TypeError("command_string must be a string")
 
-    if timeout is not None and (not isinstance(timeout, int) or timeout <= 0):
-        raise ValueError("timeout must be a positive integer or None")
+        if timeout is not None and (type(timeout) is not int or timeout <= 0):
+            raise ValueError("timeout must be a positive integer or None")
 
     try:
         # Create subprocess in daemon mode
-        process = subprocess.Popen(
-            command_string,
-            shell=True,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True,
-            preexec_fn=os.setsid,  # Create new process group to isolate from terminal signals
-        )
+        process = _POPEN_DAEMON(command_string)
 
         pid = process.pid
 
@@ -91,13 +403,35 @@ def run_shell_command_daemon(command_string: str, timeout: int = 180) -> dict:
             "start_time": datetime.now(),
             "status": "running",
             "timeout": timeout,
+            "proc": process,
+            "output": deque(maxlen=1024),
         }
 
+        pidfd = None
+        if _HAS_PIDFD:
+            try:
+                pidfd = os.pidfd_open(pid)
+            except OSError:
+                pidfd = None
+        process_info["pidfd"] = pidfd
+
         with _process_lock:
             _daemon_processes[pid] = process_info
 
-        # If a timeout is specified, set up automatic termination
-        if timeout is not None:
+        # Drain both pipes continuously so the child never stalls on a
+        # full pipe buffer
+        reader = _get_pipe_reader()
+        reader.register(pid, process.stdout)
+        reader.register(pid, process.stderr)
+
+        if pidfd is not None:
+            # One shared reaper thread handles exit detection and the
+            # timeout for every daemon
+            deadline = time.monotonic() + timeout if timeout is not None else None
+            _get_reaper().watch(pid, pidfd, deadline)
+        elif timeout is not None:
+            # Fallback for platforms without pidfd support: dedicated
+            # watchdog thread per timed daemon
 
             def kill_after_timeout():
                 time.sleep(timeout)
@@ -109,8 +443,16 @@ def run_shell_command_daemon(command_string: str, timeout: int = 180) -> dict:
                             and _daemon_processes[pid]["status"] == "running"
                         ):
                             os.killpg(os.getpgid(pid), signal.SIGTERM)
-                            _daemon_processes[pid]["status"] = "terminated"
-                            _daemon_processes[pid]["end_time"] = datetime.now()
+                            _mark_terminated(pid, _daemon_processes[pid])
+                    try:
+                        process.wait(timeout=5)
+                    except subprocess.TimeoutExpired:
+                        os.killpg(os.getpgid(pid), signal.SIGKILL)
+                        process.wait()
+                    with _process_lock:
+                        info = _daemon_processes.get(pid)
+                        if info is not None:
+                            _release_process(info, process.returncode)
                 except Exception:
                     # Process might have already terminated
                     pass
@@ -139,19 +481,26 @@ def list_daemon_processes() -> List[dict]:
     """
     _cleanup_terminated_processes()
 
+    # Snapshot references under the lock; build the result dicts outside it
+    # so the critical section is O(N) pointer copies, not O(N) allocations
     with _process_lock:
-        # Return copy of current processes to avoid external modification
-        return [
-            {
-                "pid": pid,
-                "command": info["command"],
-                "start_time": info["start_time"],
-                "status": info["status"],
-            }
+        snapshot = [
+            (pid, info)
             for pid, info in _daemon_processes.items()
             if info.get("status") == "running"
         ]
 
+    # Return copy of current processes to avoid external modification
+    return [
+        {
+            "pid": pid,
+            "command": info["command"],
+            "start_time": info["start_time"],
+            "status": info["status"],
+        }
+        for pid, info in snapshot
+    ]
+
 
 def terminate_daemon_process(pid: int) -> bool:
     """
@@ -169,15 +518,29 @@ def terminate_daemon_process(pid: int) -> bool:
                 return False
 
             # Mark as terminating first
-            _daemon_processes[pid]["status"] = "terminating"
+            info = _daemon_processes[pid]
+            info["status"] = "terminating"
+            proc = info.get("proc")
+            has_pidfd = info.get("pidfd") is not None
 
         # Send SIGTERM to the process group (to handle child processes)
         os.killpg(os.getpgid(pid), signal.SIGTERM)
 
+        # With a pidfd the reaper reaps the child and closes its pipes as
+        # soon as it exits; without one, wait here so no zombie is left
+        if not has_pidfd and proc is not None:
+            try:
+                proc.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                os.killpg(os.getpgid(pid), signal.SIGKILL)
+                proc.wait()
+
         with _process_lock:
             if pid in _daemon_processes:
-                _daemon_processes[pid]["status"] = "terminated"
-                _daemon_processes[pid]["end_time"] = datetime.now()
+                info = _daemon_processes[pid]
+                _mark_terminated(pid, info)
+                if not has_pidfd:
+                    _release_process(info, proc.returncode if proc else None)
 
         return True
 
@@ -185,8 +548,7 @@ def terminate_daemon_process(pid: int) -> bool:
         # If process already terminated or doesn't exist, that's okay
         with _process_lock:
             if pid in _daemon_processes:
-                _daemon_processes[pid]["status"] = "terminated"
-                _daemon_processes[pid]["end_time"] = datetime.now()
+                _mark_terminated(pid, _daemon_processes[pid])
         return False
 
 
@@ -205,21 +567,38 @@ def check_daemon_status(pid: int) -> dict:
             return {"status": "not_found"}
 
         info = _daemon_processes[pid]
-        # Check actual process status
-        try:
-            os.kill(pid, 0)  # This will raise OSError if process doesn't exist
-            # Process exists, check if it's still running or terminated
-            if info["status"] == "running":
-                return {
-                    "pid": pid,
-                    "command": info["command"],
-                    "start_time": info["start_time"],
-                    "status": "running",
-                }
-        except OSError:
-            # Process doesn't exist, update registry
-            _daemon_processes[pid]["status"] = "terminated"
-            _daemon_processes[pid]["end_time"] = datetime.now()
+        pidfd = info.get("pidfd")
+
+        if info["status"] == "running":
+            if pidfd is not None:
+                # The pidfd identifies this exact child (no PID-reuse race);
+                # readable means exited. The reaper usually flips the status
+                # first, making this a pure registry read.
+                try:
+                    readable, _, _ = select.select([pidfd], [], [], 0)
+                except OSError:
+                    # fd already closed by the reaper mid-transition
+                    readable = [pidfd]
+                if not readable:
+                    return {
+                        "pid": pid,
+                        "command": info["command"],
+                        "start_time": info["start_time"],
+                        "status": "running",
+                    }
+                _mark_terminated(pid, info)
+            else:
+                # Fallback probe for platforms without pidfd support
+                try:
+                    os.kill(pid, 0)
+                    return {
+                        "pid": pid,
+                        "command": info["command"],
+                        "start_time": info["start_time"],
+                        "status": "running",
+                    }
+                except OSError:
+                    _mark_terminated(pid, info)
 
         return {
             "pid": pid,
@@ -228,27 +607,50 @@ def check_daemon_status(pid: int) -> dict:
         }
 
 
+# Common frontend dev server invocations, unioned into one pattern so
+# detection is a single compiled scan instead of nine
+_FRONTEND_RE = re.compile(
+    r"(?:"
+    r"npm\s+run\s+(?:dev|start|serve)"
+    r"|yarn\s+(?:dev|start|serve)"
+    r"|pnpm\s+run\s+(?:dev|start|serve)"
+    r"|next\s+dev"
+    r"|vite\s+serve?"
+    r"|nuxt\s+(?:dev|start)"
+    r"|react-scripts\s+start"
+    r"|vue-cli-service\s+serve"
+    r"|ng\s+serve"  # Angular
+    r")",
+    re.IGNORECASE,
+)
+
+
+# Tools that can launch a dev server; anything else skips the regex scan
+_FRONTEND_CMDS = frozenset(
+    (
+        "npm",
+        "yarn",
+        "pnpm",
+        "next",
+        "vite",
+        "nuxt",
+        "react-scripts",
+        "vue-cli-service",
+        "ng",
+    )
+)
+
+
 def is_frontend_dev_server(command: str) -> bool:
     """
     Detects if a shell command string is likely starting a frontend dev server.
     """
-    # Normalize command to lowercase
-    cmd = command.lower()
-
-    # Common frontend dev server keywords
-    patterns = [
-        r"npm\s+run\s+(dev|start|serve)",
-        r"yarn\s+(dev|start|serve)",
-        r"pnpm\s+run\s+(dev|start|serve)",
-        r"next\s+dev",
-        r"vite\s+serve?",
-        r"nuxt\s+(dev|start)",
-        r"react-scripts\s+start",
-        r"vue-cli-service\s+serve",
-        r"ng\s+serve",  # Angular
-    ]
-
-    return any(re.search(p, cmd) for p in patterns)
+    # Cheap reject first: almost every shell command (ls, git, grep, ...)
+    # contains none of the dev-server tool names, so a few hash lookups
+    # avoid the regex scan entirely on the common path
+    if _FRONTEND_CMDS.isdisjoint(command.lower().split()):
+        return False
+    return _FRONTEND_RE.search(command) is not None
 
 
 def run_shell_command(
@@ -261,18 +663,19 @@ def run_shell_command(
     Runs a shell command on the host system.
     """
 
-    # Validate input parameters
-    if not isinstance(command_string, str):
-        raise TypeError("command_string must be a string")
+    # Validate input parameters (elided under python -O, like asserts)
+    if __debug__:
+        if not isinstance(command_string, str):
+            raise TypeError("command_string must be a string")
 
-    if not isinstance(interactive, bool):
-        raise TypeError("interactive must be a boolean")
+        if not isinstance(interactive, bool):
+            raise TypeError("interactive must be a boolean")
 
-    if timeout is not None and (not isinstance(timeout, int) or timeout <= 0):
-        raise ValueError("timeout must be a positive integer or None")
+        if timeout is not None and (type(timeout) is not int or timeout <= 0):
+            raise ValueError("timeout must be a positive integer or None")
 
-    if not isinstance(daemon_mode, bool):
-        raise TypeError("daemon_mode must be a boolean")
+        if not isinstance(daemon_mode, bool):
+            raise TypeError("daemon_mode must be a boolean")
 
     if is_frontend_dev_server(command_string):
         daemon_mode = True
@@ -283,17 +686,12 @@ def run_shell_command(
         return f"Started daemon process with PID: {result['pid']}"
 
     # Log command execution start
-    import logging
-
-    logger = logging.getLogger(__name__)
     logger.debug(f"Starting command execution: {command_string}")
 
     try:
         if interactive:
             logger.debug(f"Running command in interactive mode: {command_string}")
-            exit_code = execute_command_interactive(
-                command_string, shell=True, env=os.environ
-            )
+            exit_code = execute_command_interactive(command_string, shell=True)
             return f"Command exited with code: {exit_code}"
         else:
             logger.debug(f"Running command in non-interactive mode: {command_string}")
@@ -301,24 +699,14 @@ def run_shell_command(
             # Handle timeout for non-interactive mode using subprocess.run
             if timeout is not None:
                 try:
-                    result = subprocess.run(
-                        command_string,
-                        shell=True,
-                        env=os.environ,
-                        capture_output=True,
-                        text=True,
-                        timeout=timeout,
-                    )
+                    # env stays None so the child inherits the environment
+                    # in-kernel; stderr is merged into stdout at the pipe
+                    # (both frozen in _RUN's signature)
+                    result = _RUN(command_string, timeout=timeout)
                     logger.debug(
                         f"Command completed successfully with exit code: {result.returncode}"
                     )
-                    # Return combined stdout and stderr, or just stdout if no stderr
-                    output = (
-                        result.stdout + result.stderr
-                        if result.stderr
-                        else result.stdout
-                    )
-                    return output
+                    return result.stdout
                 except subprocess.TimeoutExpired as e:
                     error_msg = f"Command timed out after {timeout} seconds. Command: {command_string}"
                     logger.error(error_msg)
@@ -327,7 +715,7 @@ def run_shell_command(
             else:
                 # Use existing implementation for backward compatibility
                 exit_code, result = execute_command_realtime_combined(
-                    command_string, shell=True, env=os.environ
+                    command_string, shell=True
                 )
                 return result
 
@@ -398,6 +786,7 @@ __all__ = [
     "list_daemon_processes",
     "terminate_daemon_process",
     "check_daemon_status",
+    "get_daemon_output",
     "run_shell_command",
     "setup_signal_handlers",
 ]
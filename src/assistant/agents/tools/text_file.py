@@ -1,18 +1,30 @@
-from pathlib import Path
+import os
 from assistant.utils.json import CustomJsonEncoder
 import json
 
 def save_text_file_to_disk(path: str, content: str) -> str:
     """Save text CONTENT to a file at PATH (create directories if needed). Returns the absolute path."""
     try:
-        p = Path(path).expanduser().resolve()
-        p.parent.mkdir(parents=True, exist_ok=True)
+        # Pure string normalization; Path.resolve() would lstat every
+        # path component to chase symlinks
+        p = os.path.abspath(os.path.expanduser(path))
+        os.makedirs(os.path.dirname(p), exist_ok=True)
         if content and not isinstance(content, str):
             try:
                 content = json.dumps(content, indent=2, cls=CustomJsonEncoder)
             except Exception:
-                content = str(content)                        
-        p.write_text(content, encoding="utf-8")
+                content = str(content)
+        # Encode once and write through a raw fd; write_text would stack a
+        # TextIOWrapper/BufferedWriter just to emit the same bytes.
+        data = content.encode("utf-8")
+        fd = os.open(p, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            view = memoryview(data)
+            while view:
+                written = os.write(fd, view)
+                view = view[written:]
+        finally:
+            os.close(fd)
         return f"Saved to {p}"
     except Exception as e:
         return f"Failed to save file: {e!r}"
@@ -21,13 +33,19 @@ def save_text_file_to_disk(path: str, content: str) -> str:
 def load_text_file_from_disk(path: str) -> str:
     """Load and return the text contents of the file at PATH."""
     try:
-        p = Path(path).expanduser().absolute()
-        if not p.exists():
+        p = os.path.abspath(os.path.expanduser(path))
+        # One stat covers both the existence check and the size guard
+        try:
+            st = os.stat(p)
+        except FileNotFoundError:
             return f"File not found: {p}"
         # Basic guard against very large files in CLI
-        if p.stat().st_size > 5 * 1024 * 1024:
+        if st.st_size > 5 * 1024 * 1024:
             return f"File too large to display (>5MB): {p}"
-        data = p.read_text(encoding="utf-8", errors="ignore")
-        return data
+        # Unbuffered single-shot read; the size is already known so there
+        # is nothing for a BufferedReader to do
+        with open(p, "rb", buffering=0) as f:
+            data = f.read(st.st_size)
+        return data.decode("utf-8", errors="ignore")
     except Exception as e:
         return f"Failed to load file: {e}"
@@ -1,8 +1,14 @@
-from datetime import datetime, timezone
+from datetime import datetime
 import logging
 
 logger = logging.getLogger(__name__)
 
+_TIME_TEMPLATE = (
+    "Current local time: {}\n"
+    "Timezone: {} (UTC{}:{})\n"
+    "Human readable: {}"
+)
+
 
 def get_current_local_time() -> str:
     """
@@ -47,25 +53,18 @@ def get_current_local_time() -> str:
         - Returns timezone-aware datetime information
     """
     try:
-        # Get current time in local timezone
-        now = datetime.now(tz=timezone.utc).astimezone()
-
-        # Format ISO 8601 with timezone
-        iso_format = now.isoformat()
-
-        # Get timezone name and offset
-        tz_name = now.strftime("%Z")
-        tz_offset = now.strftime("%z")
-        # Format offset as UTC±HH:MM
-        tz_offset_formatted = f"{tz_offset[:3]}:{tz_offset[3:]}"
+        # Get current time in local timezone (astimezone with no argument
+        # attaches the local zone directly, no UTC round-trip needed)
+        now = datetime.now().astimezone()
 
-        # Human-readable format
-        human_format = now.strftime("%A, %B %d, %Y at %I:%M:%S %p")
+        # One strftime pass covers the timezone fields and the
+        # human-readable form; "|" never appears in any of them
+        tz_name, tz_offset, human_format = now.strftime(
+            "%Z|%z|%A, %B %d, %Y at %I:%M:%S %p"
+        ).split("|")
 
-        return (
-            f"Current local time: {iso_format}\n"
-            f"Timezone: {tz_name} (UTC{tz_offset_formatted})\n"
-            f"Human readable: {human_format}"
+        return _TIME_TEMPLATE.format(
+            now.isoformat(), tz_name, tz_offset[:3], tz_offset[3:], human_format
         )
     except Exception as e:
         logger.exception("Error getting current time")
@@ -0,0 +1,127 @@
+"""Shared headless-Chromium pool for the web tools.
+
+Launching Chromium costs one to two seconds and ~150MB per process, so the
+page-fetch and screenshot tools must not pay it on every call. This module
+keeps a small pool of launched browsers behind a semaphore; callers borrow
+one with :func:`get_browser_pool`'s ``acquire()`` context manager and the
+browser is returned for reuse afterwards. Browsers are recycled after a
+fixed number of uses to bound memory drift, and everything is closed at
+interpreter exit.
+"""
+
+import atexit
+import importlib.util
+import logging
+import threading
+from contextlib import contextmanager
+
+logger = logging.getLogger(__name__)
+
+# Probe for playwright without importing it; the actual import is
+# deferred to the first browser launch so cache-hit and HTTP-only code
+# paths never pay for loading the playwright machinery
+PLAYWRIGHT_AVAILABLE = importlib.util.find_spec("playwright") is not None
+
+# Launch arguments shared by every tool; built once instead of per call
+CHROMIUM_LAUNCH_ARGS = (
+    "--no-sandbox",
+    "--disable-dev-shm-usage",
+    "--disable-gpu",
+)
+
+# Maximum concurrently borrowed browsers
+POOL_SIZE = 4
+
+# Close and relaunch a browser after this many uses to avoid memory drift
+BROWSER_RECYCLE_AFTER = 100
+
+
+class _BrowserPool:
+    """Pool of launched Chromium instances guarded by a bounded semaphore."""
+
+    def __init__(self):
+        self._playwright = None
+        self._idle = []  # [browser, use_count] entries ready for reuse
+        self._lock = threading.Lock()
+        self._semaphore = threading.BoundedSemaphore(POOL_SIZE)
+        atexit.register(self.close)
+
+    def _launch(self):
+        from playwright.sync_api import sync_playwright
+
+        with self._lock:
+            if self._playwright is None:
+                self._playwright = sync_playwright().start()
+            playwright = self._playwright
+        return playwright.chromium.launch(
+            headless=True, args=list(CHROMIUM_LAUNCH_ARGS)
+        )
+
+    @contextmanager
+    def acquire(self):
+        """Borrow a launched browser; returns it to the pool on clean exit.
+
+        If the caller raises, the browser is closed rather than reused so a
+        wedged page can never poison later calls.
+        """
+        self._semaphore.acquire()
+        browser = None
+        use_count = 0
+        try:
+            with self._lock:
+                if self._idle:
+                    browser, use_count = self._idle.pop()
+            if browser is None or not browser.is_connected():
+                browser = self._launch()
+                use_count = 0
+            yield browser
+        except Exception:
+            if browser is not None:
+                try:
+                    browser.close()
+                except Exception:
+                    pass
+            raise
+        else:
+            use_count += 1
+            if use_count >= BROWSER_RECYCLE_AFTER or not browser.is_connected():
+                try:
+                    browser.close()
+                except Exception:
+                    pass
+            else:
+                with self._lock:
+                    self._idle.append([browser, use_count])
+        finally:
+            self._semaphore.release()
+
+    def close(self):
+        """Close all pooled browsers and stop Playwright."""
+        with self._lock:
+            idle, self._idle = self._idle, []
+            playwright, self._playwright = self._playwright, None
+        for browser, _ in idle:
+            try:
+                browser.close()
+            except Exception:
+                pass
+        if playwright is not None:
+            try:
+                playwright.stop()
+            except Exception:
+                pass
+
+
+# Lazy singleton so importing the package never starts Playwright
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def get_browser_pool() -> _BrowserPool:
+    """Get the shared browser pool, creating it on first use."""
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = _BrowserPool()
+    return _pool
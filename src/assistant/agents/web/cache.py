@@ -0,0 +1,126 @@
+"""On-disk cache for fetched web pages.
+
+Page fetches are stateless and the same popular URLs come back across
+sessions, so extracted content is cached in a small sqlite database under
+``~/.assistant/`` keyed by ``(url, format)``. Entries are served directly
+while fresh (one hour) and revalidated with an HTTP conditional GET via
+the stored ETag afterwards, so an unchanged page costs a 304 instead of a
+browser render. Cache failures are never allowed to break a fetch; every
+operation degrades to a miss.
+"""
+
+import logging
+import sqlite3
+import threading
+import time
+import zlib
+from collections import namedtuple
+from pathlib import Path
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+# Serve without revalidation for this long after a fetch
+CACHE_TTL_SECONDS = 3600
+
+# zlib level for stored bodies; markdown/HTML compresses several-fold
+# and level 6 costs single-digit milliseconds per typical page
+_COMPRESSION_LEVEL = 6
+
+CacheEntry = namedtuple("CacheEntry", ["body", "etag", "fresh"])
+
+
+class WebPageCache:
+    """sqlite-backed cache of extracted page content keyed by (url, format)."""
+
+    def __init__(self, path: Optional[Path] = None):
+        self._path = path or (Path.home() / ".assistant" / "web_cache.db")
+        self._conn = None
+        self._lock = threading.Lock()
+
+    def _connect(self):
+        if self._conn is None:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(str(self._path), check_same_thread=False)
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS pages ("
+                " url TEXT NOT NULL,"
+                " format TEXT NOT NULL,"
+                " body TEXT NOT NULL,"
+                " etag TEXT,"
+                " fetched_at REAL NOT NULL,"
+                " PRIMARY KEY (url, format))"
+            )
+            self._conn.commit()
+        return self._conn
+
+    def get(self, url: str, format: str) -> Optional[CacheEntry]:
+        """Look up a cached page; fresh=False means it needs revalidation."""
+        try:
+            with self._lock:
+                row = (
+                    self._connect()
+                    .execute(
+                        "SELECT body, etag, fetched_at FROM pages"
+                        " WHERE url = ? AND format = ?",
+                        (url, format),
+                    )
+                    .fetchone()
+                )
+            if row is None:
+                return None
+            body, etag, fetched_at = row
+            if isinstance(body, bytes):
+                body = zlib.decompress(body).decode("utf-8")
+            return CacheEntry(body, etag, time.time() - fetched_at < CACHE_TTL_SECONDS)
+        except Exception as e:
+            logger.debug(f"Web cache read failed for {url}: {e!r}")
+            return None
+
+    def put(self, url: str, format: str, body: str, etag: Optional[str]) -> None:
+        """Store or refresh the cached content for (url, format)."""
+        try:
+            with self._lock:
+                conn = self._connect()
+                conn.execute(
+                    "INSERT OR REPLACE INTO pages (url, format, body, etag, fetched_at)"
+                    " VALUES (?, ?, ?, ?, ?)",
+                    (
+                        url,
+                        format,
+                        zlib.compress(body.encode("utf-8"), _COMPRESSION_LEVEL),
+                        etag,
+                        time.time(),
+                    ),
+                )
+                conn.commit()
+        except Exception as e:
+            logger.debug(f"Web cache write failed for {url}: {e!r}")
+
+    def touch(self, url: str, format: str) -> None:
+        """Restart the TTL after a successful 304 revalidation."""
+        try:
+            with self._lock:
+                conn = self._connect()
+                conn.execute(
+                    "UPDATE pages SET fetched_at = ? WHERE url = ? AND format = ?",
+                    (time.time(), url, format),
+                )
+                conn.commit()
+        except Exception as e:
+            logger.debug(f"Web cache touch failed for {url}: {e!r}")
+
+
+# Lazy singleton so importing the package never touches the filesystem
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_web_page_cache() -> WebPageCache:
+    """Get the shared page cache, creating it on first use."""
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = WebPageCache()
+    return _cache
@@ -145,23 +145,23 @@ def search_google_custom_api(
         if "items" not in result or not result["items"]:
             return f"No search results found for query: {query}"
 
-        # Format results as markdown
+        # Format results as markdown; build the parts in a list and join
+        # once instead of growing a string with += per result
         items = result["items"][:num_results]
-        markdown_output = f"# Search Results for: {query}\n"
-        markdown_output += "Search engine: Google Custom Search API\n\n"
+        parts = [
+            f"# Search Results for: {query}\n"
+            "Search engine: Google Custom Search API\n\n"
+        ]
 
         for i, item in enumerate(items, 1):
             title = item.get("title", "No title")
             link = item.get("link", "")
             snippet = item.get("snippet", "No snippet available")
 
-            markdown_output += f"## Result {i}: {title}\n"
-            markdown_output += f"Source: {link}\n\n"
-            markdown_output += f"{snippet}\n\n"
-            markdown_output += "---\n\n"
+            parts.append(f"## Result {i}: {title}\nSource: {link}\n\n{snippet}\n\n---\n\n")
 
         logger.info(f"Search completed successfully. Found {len(items)} results.")
-        return markdown_output
+        return "".join(parts)
 
     except HttpError as e:
         error_reason = e.reason
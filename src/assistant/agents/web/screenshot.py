@@ -1,23 +1,44 @@
+import importlib.util
 import logging
 from pathlib import Path
 
-logger = logging.getLogger(__name__)
+from .browser import get_browser_pool
+from .urls import URL_SCHEMES, normalize_url
 
-# Check if playwright is available
-try:
-    from markdownify import markdownify as md
-    from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
-    from playwright.sync_api import sync_playwright
+logger = logging.getLogger(__name__)
 
-    PLAYWRIGHT_AVAILABLE = True
-except ImportError:
-    PLAYWRIGHT_AVAILABLE = False
+# Probe for playwright without importing it; loading it is deferred to
+# the first actual capture
+PLAYWRIGHT_AVAILABLE = importlib.util.find_spec("playwright") is not None
+if not PLAYWRIGHT_AVAILABLE:
     logger.warning(
         "Playwright not available. Install with: pip install 'fsc-assistant[web]' && "
         "playwright install chromium"
     )
 
 
+class PlaywrightTimeoutError(Exception):
+    """Placeholder rebound to playwright's TimeoutError on first capture.
+
+    Until _ensure_playwright() runs, no playwright code has executed so
+    this subclass can never be raised; it only keeps the except clause
+    below valid before that point.
+    """
+
+
+_playwright_loaded = False
+
+
+def _ensure_playwright():
+    """Import the playwright symbols needed for capturing."""
+    global PlaywrightTimeoutError, _playwright_loaded
+    if not _playwright_loaded:
+        from playwright.sync_api import TimeoutError as _TimeoutError
+
+        PlaywrightTimeoutError = _TimeoutError
+        _playwright_loaded = True
+
+
 def capture_web_page_screenshot(
     url: str,
     output_path: str,
@@ -77,10 +98,13 @@ def capture_web_page_screenshot(
             "Install with: pip install 'fsc-assistant[web]' && playwright install chromium"
         )
 
-    # Validate URL
-    if not url.startswith(("http://", "https://")):
+    # Validate URL, defaulting bare hosts to https://
+    url = normalize_url(url)
+    if not url.startswith(URL_SCHEMES):
         return f"Error: Invalid URL '{url}'. URL must start with http:// or https://"
 
+    _ensure_playwright()
+
     try:
         logger.debug(f"Capturing screenshot of: {url}")
 
@@ -88,20 +112,13 @@ def capture_web_page_screenshot(
         output_file = Path(output_path).expanduser().resolve()
         output_file.parent.mkdir(parents=True, exist_ok=True)
 
-        with sync_playwright() as p:
-            # Launch browser in headless mode
-            browser = p.chromium.launch(
-                headless=True,
-                args=[
-                    "--no-sandbox",
-                    "--disable-dev-shm-usage",
-                    "--disable-gpu",
-                ],
-            )
+        # Borrow a launched browser from the shared pool instead of paying
+        # a full Chromium launch/teardown on every call
+        with get_browser_pool().acquire() as browser:
+            # Create a new page with specified viewport
+            page = browser.new_page()
 
             try:
-                # Create a new page with specified viewport
-                page = browser.new_page()
                 page.set_viewport_size(
                     {"width": viewport_width, "height": viewport_height}
                 )
@@ -110,8 +127,12 @@ def capture_web_page_screenshot(
                 logger.debug(f"Navigating to {url}...")
                 page.goto(url, timeout=timeout, wait_until="domcontentloaded")
 
-                # Wait a bit for rendering
-                page.wait_for_timeout(2000)
+                # Wait for the network to go quiet instead of a fixed
+                # 2s sleep; chatty pages fall back to the old behavior
+                try:
+                    page.wait_for_load_state("networkidle", timeout=3000)
+                except PlaywrightTimeoutError:
+                    pass
 
                 # Capture screenshot
                 logger.debug(f"Capturing screenshot to {output_file}...")
@@ -122,8 +143,8 @@ def capture_web_page_screenshot(
                 return f"Screenshot saved to: {output_file}"
 
             finally:
-                # Always close the browser
-                browser.close()
+                # Close the page; the browser itself goes back to the pool
+                page.close()
 
     except PlaywrightTimeoutError:
         error_msg = f"Error: Page load timed out after {timeout/1000}s for URL: {url}"
@@ -0,0 +1,17 @@
+"""URL helpers shared by the web tools."""
+
+# Hoisted so validation doesn't rebuild the tuple on every call
+URL_SCHEMES = ("http://", "https://")
+
+
+def normalize_url(url: str) -> str:
+    """Fill in a missing scheme instead of bouncing the caller.
+
+    Bare hosts like ``example.com/page`` or ``www.example.com`` become
+    ``https://`` URLs; anything that already carries a scheme is returned
+    unchanged so the caller's validation still rejects unsupported ones.
+    """
+    url = url.strip()
+    if not url or url.startswith(URL_SCHEMES) or "://" in url:
+        return url
+    return "https://" + url
@@ -1,23 +1,203 @@
+import importlib.util
 import logging
-from typing import Literal
+import re
+import threading
+from typing import Literal, Optional
 
+from .browser import get_browser_pool
+from .cache import get_web_page_cache
+from .urls import URL_SCHEMES, normalize_url
 
 logger = logging.getLogger(__name__)
 
-# Check if playwright is available
-try:
-    from markdownify import markdownify as md
-    from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
-    from playwright.sync_api import sync_playwright
+# Sentinel for a conditional GET answered with 304 Not Modified
+_NOT_MODIFIED = object()
 
-    PLAYWRIGHT_AVAILABLE = True
-except ImportError:
-    PLAYWRIGHT_AVAILABLE = False
+# Main-content subtree used for markdown conversion; page chrome (nav,
+# sidebars, footers) usually dominates the HTML markdownify has to walk
+# without adding anything to the extracted text
+_MAIN_CONTENT_HTML_JS = (
+    "() => {"
+    " const el = document.querySelector('main,article,#content') || document.body;"
+    " return el ? el.outerHTML : document.documentElement.outerHTML;"
+    "}"
+)
+
+# innerText of the main-content node only, capped at 1MB so a
+# pathological page cannot flood the CDP transport
+_MAIN_CONTENT_TEXT_JS = (
+    "() => {"
+    " const n = document.querySelector('main,article,[role=main],#content,#main');"
+    " return (n || document.body).innerText.slice(0, 1000000);"
+    "}"
+)
+
+# True once the page has loaded and carries a useful amount of text;
+# used to cut the render wait short instead of always sleeping wait_time
+_CONTENT_READY_JS = (
+    "() => document.readyState === 'complete'"
+    " && document.body && document.body.innerText.length > 500"
+)
+
+# Probe for the optional web dependencies without importing them;
+# playwright alone costs several hundred ms and tens of MB to load, which
+# cache hits and plain-HTTP fetches never need
+PLAYWRIGHT_AVAILABLE = (
+    importlib.util.find_spec("playwright") is not None
+    and importlib.util.find_spec("markdownify") is not None
+)
+if not PLAYWRIGHT_AVAILABLE:
     logger.warning(
         "Playwright not available. Install with: pip install 'fsc-assistant[web]' && "
         "playwright install chromium"
     )
 
+# Check if httpx is available for the HTTP-first fast path
+try:
+    import httpx
+
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+
+# Bound lazily by _ensure_markdownify()
+md = None
+
+
+class PlaywrightTimeoutError(Exception):
+    """Placeholder rebound to playwright's TimeoutError on first browser use.
+
+    Until _ensure_playwright() runs, no playwright code has executed so
+    this subclass can never be raised; it only keeps the except clauses
+    below valid on the browser-free code paths.
+    """
+
+
+def _ensure_markdownify():
+    """Import markdownify on first markdown conversion."""
+    global md
+    if md is None:
+        from markdownify import markdownify
+
+        md = markdownify
+
+
+_playwright_loaded = False
+
+
+def _ensure_playwright():
+    """Import the playwright symbols needed by the browser path."""
+    global PlaywrightTimeoutError, _playwright_loaded
+    if not _playwright_loaded:
+        from playwright.sync_api import TimeoutError as _TimeoutError
+
+        PlaywrightTimeoutError = _TimeoutError
+        _playwright_loaded = True
+
+# Markers of client-side-rendered shells whose initial HTML is an empty
+# mount point; those pages genuinely need the browser
+_JS_SHELL_MARKERS = ('id="__next"', 'id="root"', 'id="app"', "window.__nuxt__")
+
+# Main-content subtree in raw HTML, mirroring _MAIN_CONTENT_HTML_JS
+_MAIN_CONTENT_RE = re.compile(r"<(main|article)\b.*?</\1\s*>", re.IGNORECASE | re.DOTALL)
+
+# Ad/analytics hosts; their responses never contribute to page content
+_TRACKER_HOST_MARKERS = (
+    "doubleclick",
+    "googletagmanager",
+    "googlesyndication",
+    "facebook.net",
+    "hotjar",
+)
+
+_http_client = None
+_http_client_lock = threading.Lock()
+
+
+def _make_route_handler(format: str):
+    """Build a page.route handler that aborts resources we never consume.
+
+    Images, media and fonts are pure overhead for content extraction; for
+    the markdown and text formats stylesheets are dropped too. Requests to
+    known tracker hosts are aborted for every format.
+    """
+    blocked_types = {"image", "media", "font"}
+    if format != "html":
+        blocked_types.add("stylesheet")
+
+    def _abort_heavy(route):
+        request = route.request
+        if request.resource_type in blocked_types:
+            route.abort()
+            return
+        url = request.url
+        for marker in _TRACKER_HOST_MARKERS:
+            if marker in url:
+                route.abort()
+                return
+        route.continue_()
+
+    return _abort_heavy
+
+
+def _get_http_client():
+    """Get the shared keep-alive HTTP client, creating it on first use.
+
+    One client for the process means TLS handshakes and DNS lookups are
+    amortized across fetches of the same origin. HTTP/2 multiplexing is
+    enabled when the optional h2 package is installed.
+    """
+    global _http_client
+    if _http_client is None:
+        with _http_client_lock:
+            if _http_client is None:
+                _http_client = httpx.Client(
+                    http2=importlib.util.find_spec("h2") is not None,
+                    follow_redirects=True,
+                    timeout=httpx.Timeout(10.0, connect=5.0),
+                    limits=httpx.Limits(
+                        max_connections=20, max_keepalive_connections=10
+                    ),
+                    headers={"User-Agent": "Mozilla/5.0 (X11; Linux x86_64)"},
+                )
+    return _http_client
+
+
+def _static_html_usable(html: str) -> bool:
+    """Heuristic: does this server-rendered HTML already carry the content?"""
+    lowered = html.lower()
+    for marker in _JS_SHELL_MARKERS:
+        if marker in lowered:
+            return False
+    return len(html) >= 20_000 or "<main" in lowered or "<article" in lowered
+
+
+def _try_http_fetch(url: str, timeout: int, etag: Optional[str] = None):
+    """Attempt a plain HTTP GET; return usable HTML or None to escalate.
+
+    When ``etag`` is given the GET is conditional and ``_NOT_MODIFIED`` is
+    returned on a 304, meaning the caller's cached copy is still valid.
+    Otherwise returns an ``(html, etag)`` pair, or None whenever the
+    response is not usable as-is (non-200, non-HTML, or a JS-gated shell
+    page) so the caller falls back to the full Playwright path.
+    """
+    try:
+        headers = {"If-None-Match": etag} if etag else None
+        response = _get_http_client().get(url, timeout=timeout / 1000, headers=headers)
+        if etag and response.status_code == 304:
+            return _NOT_MODIFIED
+        if response.status_code != 200:
+            return None
+        if "html" not in response.headers.get("content-type", "").lower():
+            return None
+        html = response.text
+        if not _static_html_usable(html):
+            return None
+        return html, response.headers.get("etag")
+    except Exception as e:
+        logger.debug(f"HTTP-first fetch of {url} failed ({e!r}); using browser")
+        return None
+
 
 def fetch_webpage_content(
     url: str,
@@ -64,8 +244,9 @@ def fetch_webpage_content(
             "Install with: pip install 'fsc-assistant[web]' && playwright install chromium"
         )
 
-    # Validate URL
-    if not url.startswith(("http://", "https://")):
+    # Validate URL, defaulting bare hosts to https://
+    url = normalize_url(url)
+    if not url.startswith(URL_SCHEMES):
         return f"Error: Invalid URL '{url}'. URL must start with http:// or https://"
 
     # Validate format
@@ -74,58 +255,113 @@ def fetch_webpage_content(
             f"Error: Invalid format '{format}'. Must be 'markdown', 'text', or 'html'"
         )
 
+    if format == "markdown":
+        _ensure_markdownify()
+
     try:
         logger.debug(
             f"Fetching web page: {url} (format={format}, wait_time={wait_time}s)"
         )
 
-        with sync_playwright() as p:
-            # Launch browser in headless mode
-            browser = p.chromium.launch(
-                headless=True,
-                args=[
-                    "--no-sandbox",
-                    "--disable-dev-shm-usage",
-                    "--disable-gpu",
-                ],
+        # Serve straight from the on-disk cache while the entry is fresh
+        cache = get_web_page_cache()
+        cached = cache.get(url, format)
+        if cached is not None and cached.fresh:
+            logger.debug(f"Served {url} ({format}) from web page cache")
+            return cached.body
+
+        # HTTP-first fast path: static pages are served from a plain GET
+        # without ever starting a browser. A stale cache entry is
+        # revalidated here with its ETag, so an unchanged page costs a
+        # 304 instead of a transfer. The text format needs the rendered
+        # innerText, so it always goes through Playwright.
+        if HTTPX_AVAILABLE and format in ("markdown", "html"):
+            fetched = _try_http_fetch(
+                url, timeout, etag=cached.etag if cached else None
             )
+            if fetched is _NOT_MODIFIED:
+                logger.debug(f"Revalidated {url} ({format}) via ETag")
+                cache.touch(url, format)
+                return cached.body
+            if fetched is not None:
+                logger.debug(f"Served {url} from plain HTTP fetch")
+                html, etag = fetched
+                if format == "html":
+                    content = html
+                else:
+                    main = _MAIN_CONTENT_RE.search(html)
+                    content = md(
+                        main.group(0) if main else html,
+                        heading_style="ATX",
+                        bullets="-",
+                    )
+                cache.put(url, format, content, etag)
+                return content
+
+        _ensure_playwright()
+
+        # Borrow a launched browser from the shared pool instead of paying
+        # a full Chromium launch/teardown on every call
+        with get_browser_pool().acquire() as browser:
+            # Create a new page
+            page = browser.new_page()
 
             try:
-                # Create a new page
-                page = browser.new_page()
+                # Abort images/media/fonts and tracker requests at the
+                # network layer; only the text/HTML is consumed
+                page.route("**/*", _make_route_handler(format))
 
-                # Set a reasonable viewport size
-                page.set_viewport_size({"width": 1280, "height": 720})
+                # Set a reasonable viewport size; layout cost scales with
+                # it, and text extraction needs no desktop-sized canvas
+                if format == "html":
+                    page.set_viewport_size({"width": 1280, "height": 720})
+                else:
+                    page.set_viewport_size({"width": 800, "height": 600})
 
                 # Navigate to the URL with timeout
                 logger.debug(f"Navigating to {url}...")
                 page.goto(url, timeout=timeout, wait_until="domcontentloaded")
 
-                # Wait for JavaScript rendering
+                # Wait for JavaScript rendering. For text/markdown the
+                # wait stops as soon as real content is present instead of
+                # always sleeping the full wait_time.
                 if wait_time > 0:
                     logger.debug(f"Waiting {wait_time}s for JavaScript rendering...")
-                    page.wait_for_timeout(wait_time * 1000)
+                    if format == "html":
+                        page.wait_for_timeout(wait_time * 1000)
+                    else:
+                        try:
+                            page.wait_for_function(
+                                _CONTENT_READY_JS, timeout=wait_time * 1000
+                            )
+                        except PlaywrightTimeoutError:
+                            # Extract whatever has rendered by now
+                            pass
 
                 # Extract content based on format
                 if format == "html":
                     content = page.content()
                 elif format == "text":
-                    # Get text content from body
-                    content = page.evaluate("() => document.body.innerText")
+                    # Get text content from the main-content node
+                    content = page.evaluate(_MAIN_CONTENT_TEXT_JS)
                 else:  # markdown
-                    # Get HTML and convert to markdown
-                    html_content = page.content()
+                    # Convert only the main-content subtree to markdown
+                    html_content = page.evaluate(_MAIN_CONTENT_HTML_JS)
                     content = md(html_content, heading_style="ATX", bullets="-")
 
                 logger.debug(
                     f"Successfully extracted {len(content)} characters from {url}"
                 )
 
+                # No ETag from the browser path; the entry is still served
+                # for the TTL window
+                cache.put(url, format, content, None)
+
                 return content
 
             finally:
-                # Always close the browser
-                browser.close()
+                # Close the page; the browser itself goes back to the pool
+                page.close()
 
     except PlaywrightTimeoutError:
         error_msg = f"Error: Page load timed out after {timeout/1000}s for URL: {url}"
@@ -1,7 +1,16 @@
 """External integrations."""
 
-from .openspec import openspec_group
-
 __all__ = [
     "openspec_group",
 ]
+
+
+def __getattr__(name):
+    # Importing .openspec pulls in rich and click and builds a Console at
+    # module scope; defer that until the attribute is actually requested
+    # so 'import assistant.integrations' stays cheap.
+    if name == "openspec_group":
+        from .openspec import openspec_group
+
+        return openspec_group
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
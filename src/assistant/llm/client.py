@@ -100,7 +100,7 @@ class LLMClient:
         max_completion_tokens: int = 0,
         temperature=0.1,
     ) -> str:
-        resp_text = ""
+        chunks = []
         for chunk in self.invoke_model_generator(
             prompt=prompt,
             messages=messages,
@@ -109,8 +109,8 @@ class LLMClient:
             temperature=temperature,
         ):
             print(chunk, end="", flush=True)
-            resp_text += chunk
-        return resp_text
+            chunks.append(chunk)
+        return "".join(chunks)
 
     def invoke_model_generator(
         self,
@@ -164,6 +164,62 @@ class LLMClient:
             except Exception as err:  # pylint: disable=broad-except
                 logger.error("Unexpected error invoking model stream: %s", err)
 
+    async def ainvoke_model_generator(
+        self,
+        prompt=None,
+        messages=None,
+        max_tokens: int = 0,
+        max_completion_tokens: int = 16_000,
+        temperature=0.1,
+        system_prompt=None,
+        model_id: Optional[str] = None,
+    ):
+        """Async variant of :meth:`invoke_model_generator`.
+
+        Allows callers to overlap LLM streaming with other coroutine work
+        (e.g. running several model calls concurrently via ``asyncio.gather``).
+        """
+        assert prompt is not None or messages is not None, "prompt or messages is required"
+        input_messages = (
+            messages if messages is not None else [{"role": "user", "content": prompt}]
+        )
+        if system_prompt:
+            input_messages = [{"role": "system", "content": system_prompt}] + input_messages
+
+        req_max_tokens = max(max_tokens, max_completion_tokens, self.max_completion_tokens)
+        if req_max_tokens and req_max_tokens > self.max_completion_tokens:
+            req_max_tokens = self.max_completion_tokens
+
+        logger.debug("Messages to LLM: %s", json.dumps(input_messages, indent=2))
+
+        models = [model_id] if model_id else list(self._candidate_models())
+        for candidate in models:
+            logger.debug("Running against model: %s", candidate)
+            request = ChatRequest(
+                messages=input_messages,
+                model=candidate,
+                temperature=temperature,
+                max_completion_tokens=req_max_tokens,
+            )
+            try:
+                response_text = ""
+                async for chunk in self.transport.astream_chat(request):
+                    delta = chunk.raw.choices[0].delta
+                    resp_chunk = getattr(delta, "content", None)
+                    if resp_chunk is not None:
+                        response_text += resp_chunk
+                        yield resp_chunk
+                if response_text:
+                    break
+            except RateLimitError as err:
+                logger.error("Rate limit exceeded: %s", err)
+            except BadRequestError as err:
+                logger.error("Bad request error: %s", err)
+            except OpenAIError as err:
+                logger.error("OpenAI error: %s", err)
+            except Exception as err:  # pylint: disable=broad-except
+                logger.error("Unexpected error invoking model stream: %s", err)
+
     def _candidate_models(self) -> Iterable[str]:
         preferred = self.user_selected_model
         return self.transport.available_models(preferred)
@@ -2,7 +2,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Any, Dict, Iterable, Iterator, List, Optional
+from typing import Any, AsyncIterator, Dict, Iterable, Iterator, List, Optional
 
 from .config import LLMProviderConfig
 
@@ -41,17 +41,17 @@ class LLMTransportClient:
     def __init__(self, provider_config: LLMProviderConfig):
         self._provider_config = provider_config
         self._client = None
+        self._async_client = None
         self._openai_module = None
 
-    def _ensure_client(self) -> Any:
-        if self._client is not None:
-            return self._client
-
+    def _ensure_openai_module(self) -> Any:
         if self._openai_module is None:
             import openai
 
             self._openai_module = openai
+        return self._openai_module
 
+    def _client_kwargs(self) -> Dict[str, Any]:
         client_kwargs: Dict[str, Any] = {
             "api_key": self._provider_config.api_key,
             "timeout": self._provider_config.timeout.as_httpx_timeout(),
@@ -67,15 +67,34 @@ class LLMTransportClient:
                 **extra_headers,
                 "Username": getuser(),
             }
+        return client_kwargs
+
+    def _ensure_client(self) -> Any:
+        if self._client is not None:
+            return self._client
 
-        self._client = self._openai_module.OpenAI(**client_kwargs)
+        openai = self._ensure_openai_module()
+        self._client = openai.OpenAI(**self._client_kwargs())
         return self._client
 
+    def _ensure_async_client(self) -> Any:
+        if self._async_client is not None:
+            return self._async_client
+
+        openai = self._ensure_openai_module()
+        self._async_client = openai.AsyncOpenAI(**self._client_kwargs())
+        return self._async_client
+
     @property
     def client(self) -> Any:
         """Expose the lazily created OpenAI client."""
         return self._ensure_client()
 
+    @property
+    def async_client(self) -> Any:
+        """Expose the lazily created AsyncOpenAI client."""
+        return self._ensure_async_client()
+
     def available_models(self, preferred: Optional[str] = None) -> Iterable[str]:
         """Yield configured models, preferring the requested one if present."""
         return self._provider_config.iter_models(preferred)
@@ -94,6 +113,20 @@ class LLMTransportClient:
         for chunk in stream:
             yield ChatStreamChunk(raw=chunk)
 
+    async def aexecute_chat(self, request: ChatRequest) -> ChatResponse:
+        """Execute a non-streaming chat completion on the async client."""
+        payload = self._build_payload(request)
+        response = await self.async_client.chat.completions.create(**payload)
+        return ChatResponse(raw=response)
+
+    async def astream_chat(self, request: ChatRequest) -> AsyncIterator[ChatStreamChunk]:
+        """Execute a streaming chat completion on the async client."""
+        payload = self._build_payload(request)
+        payload["stream"] = True
+        stream = await self.async_client.chat.completions.create(**payload)
+        async for chunk in stream:
+            yield ChatStreamChunk(raw=chunk)
+
     def _build_payload(self, request: ChatRequest) -> Dict[str, Any]:
         payload: Dict[str, Any] = {
             "model": request.model,
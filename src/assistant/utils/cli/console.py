@@ -1,6 +1,9 @@
+import atexit
+import datetime
 import signal
+from io import StringIO
 from pathlib import Path
-from typing import Literal, Optional
+from typing import List, Literal, Optional
 
 from prompt_toolkit import HTML, PromptSession
 from prompt_toolkit import print_formatted_text as console_print
@@ -25,14 +28,48 @@ COLORS = [
     "ansiwhite",
 ]
 
+# Single words that submit immediately on the next empty line
+EXIT_WORDS = frozenset({"quit", "exit", "bye", "\\q"})
+
+
+class BufferedFileHistory(FileHistory):
+    """FileHistory that batches appends instead of opening the file per line.
+
+    Entries are buffered in memory and flushed every ``FLUSH_EVERY``
+    submissions and at interpreter exit, using the same on-disk format as
+    FileHistory so existing history files stay compatible.
+    """
+
+    FLUSH_EVERY = 8
+
+    def __init__(self, filename: str) -> None:
+        self._pending: List[str] = []
+        super().__init__(filename)
+        atexit.register(self.flush)
+
+    def store_string(self, string: str) -> None:
+        self._pending.append(string)
+        if len(self._pending) >= self.FLUSH_EVERY:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write any buffered entries to the history file."""
+        if not self._pending:
+            return
+        pending, self._pending = self._pending, []
+        with open(self.filename, "ab") as f:
+            for string in pending:
+                f.write(f"\n# {datetime.datetime.now()}\n".encode("utf-8", errors="replace"))
+                for line in string.split("\n"):
+                    f.write(f"+{line}\n".encode("utf-8", errors="replace"))
+
 
 class CLIConsole:
     def __init__(self):
         assistant_hist = Path.home() / ".assistant/.kara_prompt_history"
-        if assistant_hist.exists() is False:
-            assistant_hist.parent.mkdir(exist_ok=True)
-            assistant_hist.write_text("")
-        self.prompt_history = FileHistory(assistant_hist.resolve())
+        assistant_hist.parent.mkdir(exist_ok=True)
+        assistant_hist.touch(exist_ok=True)
+        self.prompt_history = BufferedFileHistory(assistant_hist.resolve())
         self.prompt_session = PromptSession(history=self.prompt_history)
 
     def get_multiline_input(
@@ -44,9 +81,11 @@ class CLIConsole:
                 f"<ansicyan><b>{input_prompt} (double Enter to submit):</b></ansicyan>"
             )
         )
-        lines = []
+        buffer = StringIO()
         try:
             line_pos = 0
+            first_line = ""
+            prev_empty = False
             while True:
                 line_pos += 1
                 if line_pos == 1:
@@ -58,24 +97,26 @@ class CLIConsole:
                         HTML("<ansiyellow>... </ansiyellow>")
                     )
 
-                if (
-                    len(lines) == 1
-                    and lines[0].strip() in ["quit", "exit", "bye", "\\q"]
-                    and line == ""
-                ):
-                    break
-                elif line == "" and lines and lines[-1] == "":
-                    lines.pop()  # Remove the last empty line
-                    break
-                lines.append(line)
-                
+                if line == "":
+                    if line_pos == 2 and first_line.strip() in EXIT_WORDS:
+                        break
+                    if prev_empty:
+                        break
+                    prev_empty = True
+                else:
+                    prev_empty = False
+                    if line_pos == 1:
+                        first_line = line
+                buffer.write(line)
+                buffer.write("\n")
+
                 #signal.CTRL_BREAK_EVENT
 
         except KeyboardInterrupt:
             console_print(HTML(f"<ansiyellow>Input cancelled</ansiyellow>"))
             return None
 
-        prompt = "\n".join(lines).strip()
+        prompt = buffer.getvalue().strip()
         return prompt if prompt else None
 
     def prompt_input(self, input_prompt: str = "Enter your prompt") -> str:
@@ -22,8 +22,11 @@ class CustomJsonEncoder(json.JSONEncoder):
 
 def extract_json_from_text(text: str) -> str:
     """
-    Extracts the JSON object from a given text string.
-    The JSON object is expected to be enclosed within the first pair of curly braces {}.
+    Extracts the first JSON object from a given text string.
+
+    Scans the text once, matching braces while skipping string literals
+    and escape sequences, so text before or after the object (thinking
+    tokens, commentary) is ignored.
 
     Args:
         text (str): The input text containing a JSON object.
@@ -32,14 +35,33 @@ def extract_json_from_text(text: str) -> str:
         str: The extracted JSON string, or an empty string if no valid JSON is found.
     """
     start_idx = text.find("{")
-    end_idx = text.rfind("}")
+    if start_idx == -1:
+        return ""
 
-    if start_idx != -1 and end_idx != -1 and end_idx > start_idx:
-        json_str = text[start_idx : end_idx + 1]
-        try:
-            # Validate if the extracted string is a valid JSON
-            json.loads(json_str)
-            return json_str
-        except json.JSONDecodeError:
-            return ""
+    depth = 0
+    in_string = False
+    escaped = False
+    for idx in range(start_idx, len(text)):
+        char = text[idx]
+        if in_string:
+            if escaped:
+                escaped = False
+            elif char == "\\":
+                escaped = True
+            elif char == '"':
+                in_string = False
+        elif char == '"':
+            in_string = True
+        elif char == "{":
+            depth += 1
+        elif char == "}":
+            depth -= 1
+            if depth == 0:
+                json_str = text[start_idx : idx + 1]
+                try:
+                    # Validate if the extracted string is a valid JSON
+                    json.loads(json_str)
+                    return json_str
+                except json.JSONDecodeError:
+                    return ""
     return ""
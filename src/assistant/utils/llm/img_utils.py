@@ -9,6 +9,7 @@ Prerequisites:
 import base64
 import io
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Tuple, Union
 
@@ -135,6 +136,22 @@ def _file_to_data_url_with_limit(image_path: str, max_bytes: int) -> str:
         return _downscale_and_compress_to_limit(img, max_bytes, preferred_fmt=fmt)
 
 
+def _encode_images(paths: Tuple[Union[Path, str], ...], max_bytes: int) -> list:
+    """
+    Encode each image path to a data URL, in order. Multiple images are
+    processed on a small thread pool: the disk reads and Pillow/base64
+    encoding release the GIL, so the per-file work overlaps.
+    """
+    if len(paths) == 1:
+        return [_file_to_data_url_with_limit(str(paths[0]), max_bytes)]
+    with ThreadPoolExecutor(max_workers=min(8, len(paths))) as executor:
+        return list(
+            executor.map(
+                lambda p: _file_to_data_url_with_limit(str(p), max_bytes), paths
+            )
+        )
+
+
 def to_multipart_message_content(
     image_path: Union[Path, str],
     *image_paths: Union[Path, str],
@@ -144,11 +161,11 @@ def to_multipart_message_content(
     Create a message content list with text prompt and one or more images as data URLs.
     Each image is resized/compressed to be <= max_bytes.
     """
-    contents = []
-    for img_path in (image_path,) + image_paths:
-        data_url = _file_to_data_url_with_limit(str(img_path), max_bytes)
-        contents.append({"type": "image_url", "image_url": {"url": data_url}})
-    return contents
+    data_urls = _encode_images((image_path,) + image_paths, max_bytes)
+    return [
+        {"type": "image_url", "image_url": {"url": data_url}}
+        for data_url in data_urls
+    ]
 
 
 def to_multipart_message(
@@ -162,8 +179,7 @@ def to_multipart_message(
     Each image is resized/compressed to be <= max_bytes.
     """
     contents = [{"type": "text", "text": prompt}] if prompt else []
-    for img_path in (image_path,) + image_paths:
-        data_url = _file_to_data_url_with_limit(str(img_path), max_bytes)
+    for data_url in _encode_images((image_path,) + image_paths, max_bytes):
         contents.append({"type": "image_url", "image_url": {"url": data_url}})
     return {
         "role": "user",
@@ -36,7 +36,8 @@ def test_list_files_in_current_project(monkeypatch, tmp_path):
     (data_dir / "file2.txt").write_text("world")
     (repo_root / ".hidden.txt").write_text("secret")
 
-    monkeypatch.setattr(project, "get_project_root", lambda: repo_root)
+    monkeypatch.setattr(project, "get_project_root", lambda path=None: repo_root)
+    monkeypatch.chdir(repo_root)
 
     listing = project.list_files_in_current_project()
     entries = set(filter(None, listing.splitlines()))